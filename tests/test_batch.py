@@ -0,0 +1,34 @@
+"""The vectorized batch kernel must agree with the single-scenario core."""
+import numpy as np
+import pytest
+
+from tongue_weight import HITCH_TYPES, calculate
+from tongue_weight.batch import batch_tongue_weight, hitch_bands, pad_ragged
+
+
+def test_batch_kernel_matches_core():
+    rng = np.random.default_rng(0)
+    n = 500
+    hitch_types = rng.choice(sorted(HITCH_TYPES), n)
+    hitch_position = np.where(hitch_types == "bumper", 0.0, rng.uniform(10, 50, n))
+    counts = rng.integers(1, 8, n)
+    weights = [rng.uniform(50, 2000, k) for k in counts]
+    cgs = [rng.uniform(0, 300, k) for k in counts]
+    axles = rng.uniform(150, 280, (n, 2))
+    trailer_weight = np.where(rng.random(n) < 0.8, rng.uniform(500, 5000, n), 0.0)
+    trailer_cg = rng.uniform(100, 250, n)
+    low, high = hitch_bands(hitch_types)
+
+    batch = batch_tongue_weight(pad_ragged(weights), pad_ragged(cgs), axles, trailer_weight, trailer_cg, low, high,
+                                hitch_position)
+
+    for i in range(n):
+        core = calculate(axles[i].tolist(), list(zip(weights[i], cgs[i])), trailer_weight[i], trailer_cg[i],
+                         hitch_position[i], hitch_types[i])
+        assert batch.total_weight[i] == pytest.approx(core.total_weight)
+        assert batch.tongue_force[i] == pytest.approx(core.tongue_force_display, abs=0.005)
+        # The app rounds the force to 0.01 lbs before taking the percentage and classifying
+        pct_tol = 100 * 0.005 / core.total_weight
+        assert batch.tongue_pct[i] == pytest.approx(core.tongue_pct, abs=pct_tol)
+        if min(abs(core.tongue_pct - low[i]), abs(core.tongue_pct - high[i])) > pct_tol:
+            assert batch.in_range[i] == (core.status == "ok")
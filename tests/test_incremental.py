@@ -0,0 +1,88 @@
+"""Running totals and data editor change detection."""
+import math
+
+from tongue_weight.incremental import RunningTotals, editor_changes
+
+BASE = [(1000.0, 50.0), (2000.0, 100.0), (3000.0, 150.0), (4000.0, 200.0)]
+
+
+def state(edited=None, added=None, deleted=None):
+    return {"edited_rows": edited or {}, "added_rows": added or [], "deleted_rows": deleted or []}
+
+
+def apply_state(rows, editor_state):
+    # Same order as st.data_editor: cell edits by original position, then deletions, then additions
+    rows = [dict(w=w, cg=cg) for w, cg in rows]
+    for position, changes in editor_state["edited_rows"].items():
+        rows[position].update(changes)
+    rows = [row for i, row in enumerate(rows) if i not in set(editor_state["deleted_rows"])]
+    rows += [dict(dict(w=0.0, cg=0.0), **row) for row in editor_state["added_rows"]]
+    return [(row["w"], row["cg"]) for row in rows]
+
+
+def check_incremental(previous, current):
+    # Updating only the reported rows must give the same totals as re-summing the edited table
+    before, after = apply_state(BASE, previous), apply_state(BASE, current)
+    totals = RunningTotals(*zip(*before))
+    for i in editor_changes(previous, current, len(BASE)):
+        totals.update(i, *after[i])
+    weight, moment = totals.totals()
+    assert math.isclose(weight, sum(w for w, _ in after))
+    assert math.isclose(moment, sum(w * cg for w, cg in after))
+
+
+def test_running_totals_update_and_resum():
+    totals = RunningTotals([100.0, 200.0], [10.0, 20.0], resum_every=2)
+    totals.update(0, 150.0, 12.0)
+    assert totals.totals() == (350.0, 150.0 * 12.0 + 200.0 * 20.0)
+    totals.update(1, 0.0, 0.0)
+    assert totals.updates == 0
+    assert totals.totals() == (150.0, 1800.0)
+
+
+def test_first_run_rebuilds():
+    assert editor_changes(None, state(), len(BASE)) is None
+
+
+def test_edit():
+    previous, current = state(), state(edited={2: {"w": 3500.0}})
+    assert editor_changes(previous, current, len(BASE)) == [2]
+    check_incremental(previous, current)
+
+
+def test_second_edit_reports_only_new_row():
+    previous = state(edited={2: {"w": 3500.0}})
+    current = state(edited={2: {"w": 3500.0}, 0: {"cg": 60.0}})
+    assert editor_changes(previous, current, len(BASE)) == [0]
+    check_incremental(previous, current)
+
+
+def test_reverted_edit():
+    previous, current = state(edited={1: {"w": 2500.0}}), state()
+    assert editor_changes(previous, current, len(BASE)) == [1]
+    check_incremental(previous, current)
+
+
+def test_add_and_delete_rebuild():
+    assert editor_changes(state(), state(added=[{"w": 500.0, "cg": 20.0}]), len(BASE)) is None
+    assert editor_changes(state(), state(deleted=[1]), len(BASE)) is None
+
+
+def test_edit_after_delete_shifts_position():
+    previous = state(deleted=[0, 2])
+    current = state(edited={3: {"w": 4500.0}, 1: {"cg": 110.0}}, deleted=[0, 2])
+    assert editor_changes(previous, current, len(BASE)) == [0, 1]
+    check_incremental(previous, current)
+
+
+def test_edit_of_deleted_row_is_ignored():
+    previous = state(deleted=[1])
+    current = state(edited={1: {"w": 9999.0}}, deleted=[1])
+    assert editor_changes(previous, current, len(BASE)) == []
+
+
+def test_edit_of_added_row():
+    previous = state(added=[{"w": 500.0, "cg": 20.0}, {"w": 600.0}], deleted=[3])
+    current = state(added=[{"w": 500.0, "cg": 20.0}, {"w": 600.0, "cg": 80.0}], deleted=[3])
+    assert editor_changes(previous, current, len(BASE)) == [4]
+    check_incremental(previous, current)
@@ -0,0 +1,48 @@
+"""Rebalancing loads onto a target tongue percentage."""
+import numpy as np
+import pytest
+
+from tongue_weight import calculate
+from tongue_weight.optimize import rebalance_loads
+
+WEIGHTS = [3000.0, 1500.0, 800.0, 2200.0]
+CGS = [60.0, 110.0, 150.0, 200.0]
+AXLES = [140, 175]
+
+
+def tongue_pct(weights, cgs):
+    return calculate(AXLES, list(zip(weights, cgs))).tongue_pct
+
+
+def test_unbounded_rebalance_hits_target_with_least_squares_shifts():
+    placement = rebalance_loads(WEIGHTS, CGS, AXLES, target_pct=12.5)
+
+    assert placement.feasible
+    assert tongue_pct(WEIGHTS, placement.cgs) == pytest.approx(12.5, abs=0.01)
+    # The least-squares optimum moves each load in proportion to its weight
+    assert placement.shifts / np.asarray(WEIGHTS) == pytest.approx(np.full(4, placement.shifts[0] / WEIGHTS[0]))
+
+
+def test_bounded_rebalance_hits_target_inside_bounds():
+    lower, upper = 40.0, 160.0
+    placement = rebalance_loads(WEIGHTS, CGS, AXLES, target_pct=12.5, lower=lower, upper=upper)
+
+    assert placement.feasible
+    assert placement.tongue_pct == pytest.approx(12.5)
+    assert np.all(placement.cgs >= lower - 1e-9) and np.all(placement.cgs <= upper + 1e-9)
+    assert placement.cgs[3] == pytest.approx(upper)
+
+
+def test_fixed_loads_stay_put():
+    movable = [True, False, True, False]
+    placement = rebalance_loads(WEIGHTS, CGS, AXLES, target_pct=11.0, movable=movable)
+
+    assert placement.feasible
+    assert placement.cgs[[1, 3]] == pytest.approx([CGS[1], CGS[3]])
+
+
+def test_unreachable_target_pushes_loads_to_their_bounds():
+    placement = rebalance_loads(WEIGHTS, CGS, AXLES, target_pct=80.0, lower=50.0, upper=210.0)
+
+    assert not placement.feasible
+    assert placement.cgs == pytest.approx(np.full(4, 50.0))
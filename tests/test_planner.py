@@ -0,0 +1,60 @@
+"""The cargo planner's swap math and heuristic search against brute force."""
+import itertools
+
+import numpy as np
+import pytest
+
+from tongue_weight.planner import _block_moment, _swap_deltas, plan_cargo
+
+
+def test_swap_deltas_match_recomputed_moments():
+    rng = np.random.default_rng(1)
+    weights = rng.uniform(100, 3000, 7)
+    lengths = rng.uniform(12, 96, 7)
+    order = rng.permutation(7)
+    base = _block_moment(weights, lengths, order)
+
+    i, j, delta = _swap_deltas(weights, lengths, order)
+
+    for a, b, d in zip(i, j, delta):
+        swapped = order.copy()
+        swapped[a], swapped[b] = swapped[b], swapped[a]
+        assert base + d == pytest.approx(_block_moment(weights, lengths, swapped))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_heuristic_plan_is_never_closer_than_exact(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 7))
+    weights = rng.uniform(100, 3000, n)
+    lengths = rng.uniform(12, 96, n)
+    deck_end = lengths.sum() + rng.uniform(0, 60)
+    kwargs = dict(deck_start=0.0, deck_end=deck_end, base_weight=1500.0, base_moment=1500.0 * 90,
+                  target_pct=float(rng.uniform(8, 17)))
+
+    exact = plan_cargo(weights, lengths, [150, 185], exact=True, **kwargs)
+    heuristic = plan_cargo(weights, lengths, [150, 185], **kwargs)
+
+    for plan in (exact, heuristic):
+        assert sorted(plan.order) == list(range(n))
+        placed = np.argsort(plan.starts)
+        assert np.all(plan.starts[placed][1:] >= plan.ends[placed][:-1] - 1e-9)
+        assert plan.starts.min() >= -1e-9 and plan.ends.max() <= deck_end + 1e-9
+    assert abs(exact.tongue_pct - kwargs["target_pct"]) <= abs(heuristic.tongue_pct - kwargs["target_pct"]) + 1e-6
+
+
+def test_exact_plan_is_the_best_permutation():
+    weights = np.array([2400.0, 300.0, 1200.0, 800.0])
+    lengths = np.array([30.0, 80.0, 40.0, 24.0])
+    kwargs = dict(deck_start=0.0, deck_end=lengths.sum(), target_pct=12.5)
+
+    exact = plan_cargo(weights, lengths, [120], exact=True, **kwargs)
+
+    # With no slack the block cannot slide, so every order is one placement
+    def pct(order):
+        l = lengths[list(order)]
+        moment = weights[list(order)] @ (np.cumsum(l) - l / 2)
+        return 100 * (weights.sum() * 120 - moment) / (120 * weights.sum())
+
+    best = min(abs(pct(order) - 12.5) for order in itertools.permutations(range(4)))
+    assert abs(exact.tongue_pct - 12.5) == pytest.approx(best)
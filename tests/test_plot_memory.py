@@ -0,0 +1,29 @@
+"""Repeated layout renders must not leak figures."""
+import sys
+
+import pytest
+
+from tongue_weight.plot import render_layout
+
+resource = pytest.importorskip("resource")
+
+# A leaked figure costs about 1 MB, so a couple of hundred renders shows a leak clearly
+WARMUP = 20
+RENDERS = 200
+MAX_GROWTH_MB = 20
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def test_render_layout_memory_is_flat():
+    loads = [(500, 40), (300, 120), (800, 200)]
+    for i in range(WARMUP):
+        render_layout(240, [180, 216], loads, 100 + i, dpi=50)
+    before = _peak_rss_mb()
+    for i in range(RENDERS):
+        render_layout(240, [180, 216], loads, 100 + i, dpi=50)
+    assert _peak_rss_mb() - before < MAX_GROWTH_MB
@@ -0,0 +1,41 @@
+"""Safe loading orders must keep every checked step inside the tongue band."""
+import itertools
+
+import numpy as np
+import pytest
+
+from tongue_weight.sequence import find_safe_order, simulate_sequence
+
+AXLES = [150, 185]
+BASE_WEIGHT, BASE_MOMENT = 2000.0, 2000.0 * 145
+
+
+def in_band(order, weights, cgs, check_from):
+    steps = simulate_sequence([(weights[i], cgs[i]) for i in order], AXLES, BASE_WEIGHT, BASE_MOMENT)
+    return all(s.status == "ok" for s in steps if s.step >= check_from)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_found_orders_stay_in_band_and_misses_are_real(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 7))
+    weights = rng.uniform(200, 1000, n).tolist()
+    cgs = rng.uniform(110, 170, n).tolist()
+    check_from = int(rng.integers(1, 3))
+
+    order = find_safe_order(weights, cgs, AXLES, BASE_WEIGHT, BASE_MOMENT, check_from=check_from)
+
+    if order is None:
+        assert not any(in_band(p, weights, cgs, check_from) for p in itertools.permutations(range(n)))
+    else:
+        assert sorted(order) == list(range(n))
+        assert in_band(order, weights, cgs, check_from)
+
+
+def test_order_found_when_listed_order_fails():
+    # Loading the rear pallet first drops the tongue below the band
+    weights, cgs = [400.0, 400.0], [190.0, 130.0]
+    steps = simulate_sequence(list(zip(weights, cgs)), AXLES, BASE_WEIGHT, BASE_MOMENT)
+    assert next(steps).status == "low"
+
+    assert find_safe_order(weights, cgs, AXLES, BASE_WEIGHT, BASE_MOMENT) == [1, 0]
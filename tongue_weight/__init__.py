@@ -0,0 +1,20 @@
+"""Trailer tongue weight calculations shared by the Streamlit app and batch tools.
+
+Importing the package only loads the pure-Python core; NumPy-backed modules
+such as :mod:`tongue_weight.batch` are imported explicitly.
+"""
+from .core import (
+    HITCH_TYPES,
+    TONGUE_PCT_HIGH,
+    TONGUE_PCT_LOW,
+    TongueResult,
+    axle_average,
+    calculate,
+    classify,
+    hitch_band,
+    load_totals,
+    raw_tongue_force,
+    solve_totals,
+    tongue_pct,
+    with_trailer,
+)
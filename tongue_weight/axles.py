@@ -0,0 +1,91 @@
+"""Per-axle reactions for tandem and triple axle trailers.
+
+The trailer is a rigid body resting on the hitch ball and on each axle.
+With more than one axle the supports are statically indeterminate, so the
+split between axles comes from the suspension model:
+
+``"equalized"``
+    Leaf springs linked by equalizers carry equal loads, i.e. every axle
+    takes ``M / (n * axle_avg)``.  The hitch reaction equals the single
+    virtual-axle result used everywhere else in the app.
+``"independent"``
+    Independent torsion axles act as separate springs of stiffness ``k_i``.
+    The hitch height is fixed by the tow vehicle, so the trailer pivots
+    about the ball and axle ``i`` deflects in proportion to ``x_i``, giving
+    ``R_i = k_i * x_i * M / sum(k_j * x_j**2)``.
+
+With a fifth-wheel or gooseneck pin at ``hitch_position`` the same models
+apply with positions measured from the pin.
+
+All functions broadcast: pass scalars for one scenario, or ``(N,)`` totals
+with ``(A,)`` / NaN-padded ``(N, A)`` axle positions for a batch.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+SUSPENSIONS = ("equalized", "independent")
+
+AxleReactions = namedtuple("AxleReactions", ["tongue_force", "reactions"])
+
+
+def axle_reactions(total_weight, total_moment, axle_positions, suspension="equalized", stiffness=None,
+                   hitch_position=0.0):
+    """Solve hitch and individual axle reactions.
+
+    Returns :class:`AxleReactions` with the tongue force (positive =
+    downward on the hitch) and per-axle reactions shaped like
+    ``axle_positions`` (NaN for padded axles).  ``stiffness`` is only used
+    by the independent model; only the ratios between axles matter.
+    """
+    if suspension not in SUSPENSIONS:
+        raise ValueError(f"unknown suspension model {suspension!r}; expected one of {SUSPENSIONS}")
+
+    # Work in coordinates measured from the hitch point
+    hitch_position = np.asarray(hitch_position, dtype=float)[..., None]
+    x = np.asarray(axle_positions, dtype=float) - hitch_position
+    valid = ~np.isnan(x)
+    x0 = np.where(valid, x, 0.0)
+    total_weight = np.asarray(total_weight, dtype=float)[..., None]
+    total_moment = np.asarray(total_moment, dtype=float)[..., None] - total_weight * hitch_position
+
+    if suspension == "equalized":
+        count = valid.sum(axis=-1, keepdims=True)
+        axle_avg = x0.sum(axis=-1, keepdims=True) / count
+        reactions = total_moment / (axle_avg * count) * np.ones_like(x0)
+    else:
+        k = np.ones_like(x0) if stiffness is None else np.broadcast_to(np.asarray(stiffness, dtype=float), x0.shape)
+        k = np.where(valid, k, 0.0)
+        rotation = total_moment / (k * x0 * x0).sum(axis=-1, keepdims=True)
+        reactions = k * x0 * rotation
+
+    reactions = np.where(valid, reactions, np.nan)
+    tongue_force = (total_weight - np.nansum(reactions, axis=-1, keepdims=True))[..., 0]
+    return AxleReactions(tongue_force, reactions)
+
+
+def effective_axle_position(axle_positions, suspension="equalized", stiffness=None, hitch_position=0.0):
+    """Position of the axle group's resultant under a suspension model.
+
+    Both models split the axle load in fixed proportions, so this point does
+    not depend on the loads: the average position when equalized, and
+    ``sum(k * x**2) / sum(k * x)`` from the hitch when independent.  Using
+    it as the virtual axle reproduces the model's hitch reaction exactly.
+    """
+    if suspension not in SUSPENSIONS:
+        raise ValueError(f"unknown suspension model {suspension!r}; expected one of {SUSPENSIONS}")
+    hitch_position = np.asarray(hitch_position, dtype=float)
+    x = np.asarray(axle_positions, dtype=float) - hitch_position[..., None]
+    valid = ~np.isnan(x)
+    x0 = np.where(valid, x, 0.0)
+    if suspension == "equalized":
+        k = valid.astype(float)
+    else:
+        k = np.ones_like(x0) if stiffness is None else np.broadcast_to(np.asarray(stiffness, dtype=float), x0.shape)
+        k = np.where(valid, k, 0.0) * x0
+    return hitch_position + (k * x0).sum(axis=-1) / k.sum(axis=-1)
+
+
+def axle_utilization(reactions, ratings):
+    """Fraction of each axle's rating in use (> 1 means overloaded)."""
+    return np.asarray(reactions, dtype=float) / np.asarray(ratings, dtype=float)
@@ -0,0 +1,120 @@
+"""Vectorized tongue weight kernel for many scenarios at once.
+
+Every scenario uses the same static equilibrium as the Streamlit app: all
+axles collapse to a single virtual axle at their average position and each
+load is a point force at its CG.  Inputs are NumPy arrays with one row per
+scenario, so the whole batch is solved with a handful of array operations.
+
+Fifth-wheel and gooseneck scenarios pass a per-scenario ``hitch_position``
+(see :mod:`tongue_weight.core`) and per-scenario bands from
+:func:`hitch_bands`, so mixed fleets still solve in one pass.
+
+Ragged load lists can be passed either padded (``pad_ragged``; padding rows
+must carry zero weight) or flat with per-scenario ``counts``
+(``load_totals_flat``).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .core import HITCH_TYPES, TONGUE_PCT_HIGH, TONGUE_PCT_LOW
+
+BatchResult = namedtuple(
+    "BatchResult", ["total_weight", "axle_avg", "tongue_force", "tongue_pct", "in_range"]
+)
+
+
+def pad_ragged(rows, fill=0.0):
+    """Pack a sequence of variable-length sequences into a 2-D array."""
+    rows = [np.asarray(r, dtype=float).ravel() for r in rows]
+    width = max((len(r) for r in rows), default=0)
+    out = np.full((len(rows), width), fill, dtype=float)
+    for i, r in enumerate(rows):
+        out[i, : len(r)] = r
+    return out
+
+
+def axle_average(axle_positions):
+    """Virtual axle position per scenario.
+
+    ``axle_positions`` is either 1-D (already one axle per scenario) or 2-D
+    with NaN padding for scenarios that have fewer axles.
+    """
+    axle_positions = np.asarray(axle_positions, dtype=float)
+    if axle_positions.ndim == 1:
+        return axle_positions
+    valid = ~np.isnan(axle_positions)
+    return np.where(valid, axle_positions, 0.0).sum(axis=1) / valid.sum(axis=1)
+
+
+def load_totals(load_weights, load_cgs):
+    """Total weight and moment about the hitch for padded (N, K) load arrays."""
+    load_weights = np.asarray(load_weights, dtype=float)
+    load_cgs = np.asarray(load_cgs, dtype=float)
+    total_weight = load_weights.sum(axis=-1)
+    total_moment = np.einsum("...k,...k->...", load_weights, load_cgs)
+    return total_weight, total_moment
+
+
+def load_totals_flat(weights, cgs, counts):
+    """Total weight and moment for flat load arrays split by per-scenario ``counts``."""
+    weights = np.asarray(weights, dtype=float)
+    cgs = np.asarray(cgs, dtype=float)
+    counts = np.asarray(counts, dtype=np.intp)
+    ids = np.repeat(np.arange(len(counts)), counts)
+    total_weight = np.bincount(ids, weights=weights, minlength=len(counts))
+    total_moment = np.bincount(ids, weights=weights * cgs, minlength=len(counts))
+    return total_weight, total_moment
+
+
+def hitch_bands(hitch_types):
+    """Per-scenario ``(low, high)`` band arrays for an array of hitch type names."""
+    hitch_types = np.asarray(hitch_types)
+    low = np.full(hitch_types.shape, np.nan)
+    high = np.full(hitch_types.shape, np.nan)
+    for name, (lo, hi) in HITCH_TYPES.items():
+        mask = hitch_types == name
+        low[mask], high[mask] = lo, hi
+    if np.isnan(low).any():
+        raise ValueError(f"unknown hitch type in {sorted(set(hitch_types.ravel().tolist()) - set(HITCH_TYPES))}")
+    return low, high
+
+
+def solve_totals(total_weight, total_moment, axle_avg, low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, hitch_position=0.0):
+    """Tongue force (positive = downward), percentage and range flag from load totals."""
+    total_weight = np.asarray(total_weight, dtype=float)
+    total_moment = np.asarray(total_moment, dtype=float)
+    axle_avg = np.asarray(axle_avg, dtype=float)
+
+    raw_tongue_force = (total_moment - total_weight * axle_avg) / (axle_avg - hitch_position)
+    tongue_force = -raw_tongue_force
+    nonzero = total_weight != 0
+    tongue_pct = np.where(nonzero, 100 * tongue_force / np.where(nonzero, total_weight, 1.0), 0.0)
+    in_range = nonzero & (tongue_pct >= low) & (tongue_pct <= high)
+    return BatchResult(total_weight, axle_avg, tongue_force, tongue_pct, in_range)
+
+
+def classify(tongue_pct, total_weight, low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH):
+    """Vectorized :func:`tongue_weight.core.classify`; returns an array of status strings."""
+    tongue_pct = np.asarray(tongue_pct)
+    return np.select(
+        [np.asarray(total_weight) == 0, ~np.isfinite(tongue_pct), tongue_pct < low, tongue_pct > high],
+        ["zero", "invalid", "low", "high"],
+        "ok",
+    )
+
+
+def batch_tongue_weight(load_weights, load_cgs, axle_positions, trailer_weight=0.0, trailer_cg=0.0,
+                        low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, hitch_position=0.0):
+    """Solve N scenarios from padded (N, K) load arrays and (N,) or (N, A) axle arrays.
+
+    ``trailer_weight``/``trailer_cg``, ``low``/``high`` and
+    ``hitch_position`` may be scalars or (N,) arrays; a zero trailer weight
+    contributes nothing, just like the sidebar input.
+    """
+    total_weight, total_moment = load_totals(load_weights, load_cgs)
+    trailer_weight = np.asarray(trailer_weight, dtype=float)
+    trailer_cg = np.asarray(trailer_cg, dtype=float)
+    total_weight = total_weight + trailer_weight
+    total_moment = total_moment + trailer_weight * trailer_cg
+    return solve_totals(total_weight, total_moment, axle_average(axle_positions), low, high, hitch_position)
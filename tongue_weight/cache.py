@@ -0,0 +1,78 @@
+"""Small thread-safe LRU cache with optional time-to-live.
+
+Used to memoize rendered images and other pure results across Streamlit
+reruns and sessions.  Unlike ``st.cache_data`` it reports hit/miss counts
+and can be resized at runtime.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "size", "max_entries", "ttl"])
+
+
+class LRUCache:
+    """Least-recently-used mapping bounded by ``max_entries`` and ``ttl`` seconds."""
+
+    def __init__(self, max_entries=128, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def _expired(self, stamp, now):
+        return self.ttl is not None and now - stamp > self.ttl
+
+    def _evict(self):
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key`` (counting a hit or miss)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or self._expired(entry[0], now):
+                self._data.pop(key, None)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` on a miss."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def configure(self, max_entries=None, ttl=None):
+        """Change the eviction policy; shrinking evicts the oldest entries immediately."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if ttl is not None:
+                self.ttl = ttl if ttl > 0 else None
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses, len(self._data), self.max_entries, self.ttl)
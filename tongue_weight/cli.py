@@ -0,0 +1,111 @@
+"""Command-line batch calculator.
+
+Reads scenarios as CSV or JSON Lines (or a ``.json`` list) from a file or
+stdin and streams one result row per scenario::
+
+    python -m tongue_weight manifest.csv > results.csv
+    cat manifest.jsonl | python -m tongue_weight --format jsonl --output-format jsonl
+
+Input is processed in fixed-size chunks through the vectorized kernel, so
+memory use does not grow with the size of the manifest.  The exception is
+``--format json``: a JSON list is parsed whole before solving starts.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+
+import numpy as np
+
+from . import batch
+from .scenarios import READERS, guess_format
+
+FIELDS = ["name", "total_weight", "tongue_weight", "tongue_pct", "status"]
+
+
+def solve_chunk(scenarios):
+    """Solve a list of scenarios in one vectorized pass; returns a :class:`~tongue_weight.batch.BatchResult`."""
+    weights, cgs, load_counts, axles, axle_counts, hitches = [], [], [], [], [], []
+    for s in scenarios:
+        loads = list(s.loads)
+        if s.trailer_weight > 0:
+            loads.append((s.trailer_weight, s.trailer_cg))
+        weights.extend(w for w, _ in loads)
+        cgs.extend(cg for _, cg in loads)
+        load_counts.append(len(loads))
+        axles.extend(s.axle_positions)
+        axle_counts.append(len(s.axle_positions))
+        hitches.append(s.hitch_position)
+
+    total_weight, total_moment = batch.load_totals_flat(weights, cgs, load_counts)
+    axle_sum, _ = batch.load_totals_flat(axles, np.zeros(len(axles)), axle_counts)
+    low, high = batch.hitch_bands([s.hitch_type for s in scenarios])
+    return batch.solve_totals(total_weight, total_moment, axle_sum / np.asarray(axle_counts), low, high,
+                              np.asarray(hitches, dtype=float))
+
+
+def iter_results(scenarios, chunk_size=10000):
+    """Yield one output row (a dict) per scenario, solving ``chunk_size`` at a time."""
+    scenarios = iter(scenarios)
+    while True:
+        chunk = list(itertools.islice(scenarios, chunk_size))
+        if not chunk:
+            return
+        result = solve_chunk(chunk)
+        low, high = batch.hitch_bands([s.hitch_type for s in chunk])
+        status = batch.classify(result.tongue_pct, result.total_weight, low, high)
+        for i, s in enumerate(chunk):
+            yield {
+                "name": s.name,
+                "total_weight": round(float(result.total_weight[i]), 2),
+                "tongue_weight": round(float(result.tongue_force[i]), 2) + 0.0,
+                "tongue_pct": round(float(result.tongue_pct[i]), 2),
+                "status": str(status[i]),
+            }
+
+
+def write_results(rows, out, fmt):
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            out.write(json.dumps(row) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream tongue weight results for a file of scenarios.")
+    parser.add_argument("input", nargs="?", default="-", help="CSV or JSON Lines file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=sorted(READERS),
+                        help="input format (default: from extension, csv for stdin); json loads the whole file")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="scenarios solved per vectorized pass")
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        fmt = args.format or "csv"
+        infile = sys.stdin
+    else:
+        fmt = args.format or guess_format(args.input)
+        infile = open(args.input, encoding="utf-8", newline="")
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        write_results(iter_results(READERS[fmt](infile), args.chunk_size), outfile, args.output_format)
+    except ValueError as exc:
+        sys.exit(f"error: {exc}")
+    except BrokenPipeError:
+        # Downstream closed early (e.g. piped into head); exit quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+if __name__ == "__main__":
+    main()
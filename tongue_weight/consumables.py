@@ -0,0 +1,92 @@
+"""Consumable loads (water, fuel, spray mix) whose weight changes on the road.
+
+A tank holds up to ``capacity`` lbs of contents at its ``cg``.  Everything
+else on the trailer is folded into a fixed weight and moment once, so with
+``Cw = sum(capacity)`` and ``Cm = sum(capacity * cg)`` the state at a common
+fill fraction ``f`` is just ``W = W0 + f * Cw`` and ``M = M0 + f * Cm``.
+
+For a drain schedule every tank empties (or fills, for a negative rate) at
+a constant rate until it hits a limit, so between those events the weight
+and moment change at constant rates.  :func:`drain_curve` keeps running
+rates, advances them by the time step and only touches a tank again when
+it runs dry or full, so each point is O(1) however many tanks there are.
+
+Both curves are generators, like :func:`tongue_weight.sequence.simulate_sequence`.
+"""
+import heapq
+from collections import namedtuple
+
+import numpy as np
+
+from .core import TONGUE_PCT_HIGH, TONGUE_PCT_LOW, axle_average, classify, raw_tongue_force, tongue_pct
+
+CurvePoint = namedtuple("CurvePoint", ["x", "total_weight", "tongue_force", "tongue_pct", "status"])
+
+
+def tank_totals(capacities, cgs, fills):
+    """Weight and moment of the tank contents at ``fills`` (fractions of capacity)."""
+    contents = np.asarray(capacities, dtype=float) * np.clip(np.asarray(fills, dtype=float), 0.0, 1.0)
+    return float(contents.sum()), float(contents @ np.asarray(cgs, dtype=float))
+
+
+def _point(x, total_weight, total_moment, axle_avg, hitch_position, low, high):
+    force = -raw_tongue_force(total_weight, total_moment, axle_avg, hitch_position)
+    pct = tongue_pct(force, total_weight)
+    return CurvePoint(x, total_weight, force, pct, classify(pct, total_weight, low, high))
+
+
+def fill_curve(capacities, cgs, axle_positions, base_weight=0.0, base_moment=0.0, levels=101,
+               low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, hitch_position=0.0):
+    """Yield a :class:`CurvePoint` per fill fraction, with every tank at the same level.
+
+    ``levels`` is a point count (evenly spaced from empty to full) or an
+    iterable of fractions.  ``base_weight``/``base_moment`` cover everything
+    except the tank contents.
+    """
+    full_weight, full_moment = tank_totals(capacities, cgs, 1.0)
+    axle_avg = axle_average(axle_positions)
+    if isinstance(levels, int):
+        levels = np.linspace(0.0, 1.0, levels).tolist()
+    for f in levels:
+        yield _point(f, base_weight + f * full_weight, base_moment + f * full_moment, axle_avg, hitch_position,
+                     low, high)
+
+
+def drain_curve(capacities, cgs, fills, rates, times, axle_positions, base_weight=0.0, base_moment=0.0,
+                low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, hitch_position=0.0):
+    """Yield a :class:`CurvePoint` at each of the increasing ``times``.
+
+    Tanks start at ``fills`` and lose ``rates`` lbs per time unit (negative
+    rates fill), stopping when empty or full.  ``x`` of each point is the time.
+    """
+    capacities = [float(c) for c in capacities]
+    cgs = [float(c) for c in cgs]
+    fills = [min(max(float(f), 0.0), 1.0) for f in fills]
+    rates = [float(r) for r in rates]
+    axle_avg = axle_average(axle_positions)
+
+    tank_weight, tank_moment = tank_totals(capacities, cgs, fills)
+    weight, moment = base_weight + tank_weight, base_moment + tank_moment
+    weight_rate = moment_rate = 0.0
+    events = []  # (time the tank stops changing, tank index)
+    for i, (capacity, cg, fill, rate) in enumerate(zip(capacities, cgs, fills, rates)):
+        room = fill * capacity if rate > 0 else (1 - fill) * capacity
+        if rate and room > 0:
+            weight_rate -= rate
+            moment_rate -= rate * cg
+            heapq.heappush(events, (room / abs(rate), i))
+
+    t = 0.0
+    for target in times:
+        # Apply each tank limit reached before ``target`` at the exact time it happens
+        while events and events[0][0] <= target:
+            event_time, i = heapq.heappop(events)
+            weight += weight_rate * (event_time - t)
+            moment += moment_rate * (event_time - t)
+            weight_rate += rates[i]
+            moment_rate += rates[i] * cgs[i]
+            t = event_time
+        weight += weight_rate * (target - t)
+        moment += moment_rate * (target - t)
+        t = target
+        yield _point(target, weight, moment, axle_avg, hitch_position, low, high)
@@ -0,0 +1,99 @@
+"""Static equilibrium math for a single trailer scenario.
+
+This module is pure Python with no UI or NumPy dependency so it imports in
+milliseconds; the Streamlit app and the batch tools share it.
+
+Conventions match the app: positions are inches from the hitch, weights
+are lbs, all axles act as one virtual axle at their average position and
+each load is a point force at its CG.
+
+Fifth-wheel and gooseneck trailers couple at a pin ahead of the axles
+rather than at a bumper ball at ``x = 0``; for those, positions are
+measured from the front of the trailer and ``hitch_position`` is the pin's
+position on the same scale.  The hitch reaction then follows from moments
+about the virtual axle: ``T = (W * axle_avg - M) / (axle_avg - hitch_position)``.
+"""
+import math
+from collections import namedtuple
+
+TONGUE_PCT_LOW = 10.0
+TONGUE_PCT_HIGH = 15.0
+
+# Recommended hitch (tongue or king-pin) weight band per hitch type, as % of total weight
+HITCH_TYPES = {
+    "bumper": (TONGUE_PCT_LOW, TONGUE_PCT_HIGH),
+    "gooseneck": (15.0, 25.0),
+    "fifth_wheel": (15.0, 25.0),
+}
+
+TongueResult = namedtuple(
+    "TongueResult",
+    ["total_weight", "total_moment", "axle_avg", "raw_tongue_force", "tongue_force_display",
+     "tongue_pct", "status"],
+)
+
+
+def axle_average(axle_positions):
+    """Position of the virtual axle (mean of all axle positions)."""
+    return sum(axle_positions) / len(axle_positions)
+
+
+def with_trailer(loads, trailer_weight=0, trailer_cg=0):
+    """Return ``loads`` with the trailer structure appended when it has weight."""
+    loads = list(loads)
+    if trailer_weight > 0:
+        loads.append((trailer_weight, trailer_cg))
+    return loads
+
+
+def load_totals(loads):
+    """Total weight and total moment about the hitch of ``(weight, cg)`` pairs."""
+    total_weight = sum(w for w, _ in loads)
+    total_moment = sum(w * cg for w, cg in loads)
+    return total_weight, total_moment
+
+
+def hitch_band(hitch_type="bumper"):
+    """Recommended ``(low, high)`` hitch weight percentages for a hitch type."""
+    return HITCH_TYPES[hitch_type]
+
+
+def raw_tongue_force(total_weight, total_moment, axle_avg, hitch_position=0):
+    """Hitch reaction from moment balance (negative = downward)."""
+    return (total_moment - total_weight * axle_avg) / (axle_avg - hitch_position)
+
+
+def tongue_pct(tongue_force_display, total_weight):
+    """Tongue weight as a percentage of total weight (0 for an empty trailer)."""
+    return 100 * tongue_force_display / total_weight if total_weight else 0
+
+
+def classify(tongue_pct, total_weight, low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH):
+    """Return ``"zero"``, ``"invalid"``, ``"low"``, ``"high"`` or ``"ok"`` for a tongue percentage.
+
+    ``"invalid"`` marks a NaN or infinite percentage (e.g. no axles).
+    """
+    if total_weight == 0:
+        return "zero"
+    if not math.isfinite(tongue_pct):
+        return "invalid"
+    if tongue_pct < low:
+        return "low"
+    if tongue_pct > high:
+        return "high"
+    return "ok"
+
+
+def solve_totals(total_weight, total_moment, axle_avg, hitch_position=0, hitch_type="bumper"):
+    """Build a :class:`TongueResult` from precomputed load totals."""
+    raw = raw_tongue_force(total_weight, total_moment, axle_avg, hitch_position)
+    tongue_force_display = round(-raw, 2)  # Negate to show downward as positive
+    pct = tongue_pct(tongue_force_display, total_weight)
+    return TongueResult(total_weight, total_moment, axle_avg, raw, tongue_force_display, pct,
+                        classify(pct, total_weight, *hitch_band(hitch_type)))
+
+
+def calculate(axle_positions, loads, trailer_weight=0, trailer_cg=0, hitch_position=0, hitch_type="bumper"):
+    """Tongue weight for one scenario, exactly as shown in the app."""
+    total_weight, total_moment = load_totals(with_trailer(loads, trailer_weight, trailer_cg))
+    return solve_totals(total_weight, total_moment, axle_average(axle_positions), hitch_position, hitch_type)
@@ -0,0 +1,61 @@
+"""Distributed loads integrated in closed form.
+
+A segment is a linearly varying line load from ``start`` to ``end`` (in
+from the hitch) with intensities ``q_start`` and ``q_end`` (lbs/in), so
+uniform (``q_start == q_end``) and trapezoidal loads are single segments
+and piecewise-linear loads are runs of consecutive segments.  For a segment
+of length ``L = end - start``::
+
+    weight = L * (q_start + q_end) / 2
+    moment = L / 6 * (q_start * (2 * start + end) + q_end * (start + 2 * end))
+
+Every function works elementwise on arrays, so thousands of segments cost
+the same handful of vectorized operations as the point-load path.
+"""
+import numpy as np
+
+
+def segment_totals(starts, ends, q_starts, q_ends):
+    """Weight and moment about the hitch of each segment."""
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    q_starts = np.asarray(q_starts, dtype=float)
+    q_ends = np.asarray(q_ends, dtype=float)
+    length = ends - starts
+    weights = 0.5 * length * (q_starts + q_ends)
+    moments = length / 6 * (q_starts * (2 * starts + ends) + q_ends * (starts + 2 * ends))
+    return weights, moments
+
+
+def distributed_totals(starts, ends, q_starts, q_ends):
+    """Total weight and moment of all segments (summed over the last axis)."""
+    weights, moments = segment_totals(starts, ends, q_starts, q_ends)
+    return weights.sum(axis=-1), moments.sum(axis=-1)
+
+
+def equivalent_point_loads(starts, ends, q_starts, q_ends):
+    """Each segment as a point load ``(weight, centroid)``; zero-weight segments sit at their midpoint."""
+    weights, moments = segment_totals(starts, ends, q_starts, q_ends)
+    midpoints = 0.5 * (np.asarray(starts, dtype=float) + np.asarray(ends, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroids = np.where(weights != 0, moments / weights, midpoints)
+    return weights, centroids
+
+
+def trapezoid_from_weight(starts, ends, weights, end_ratio=1.0):
+    """Intensities ``(q_start, q_end)`` for segments of given total weight.
+
+    ``end_ratio`` is ``q_end / q_start``: 1 is uniform, 0 a triangle
+    peaking at ``start``.
+    """
+    length = np.asarray(ends, dtype=float) - np.asarray(starts, dtype=float)
+    end_ratio = np.asarray(end_ratio, dtype=float)
+    q_starts = 2 * np.asarray(weights, dtype=float) / (length * (1 + end_ratio))
+    return q_starts, q_starts * end_ratio
+
+
+def piecewise_linear(positions, intensities):
+    """Segments ``(starts, ends, q_starts, q_ends)`` for a polyline of intensities at ``positions``."""
+    positions = np.asarray(positions, dtype=float)
+    intensities = np.asarray(intensities, dtype=float)
+    return positions[:-1], positions[1:], intensities[:-1], intensities[1:]
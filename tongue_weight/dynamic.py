@@ -0,0 +1,68 @@
+"""Tongue load under braking, acceleration and road grade.
+
+With the trailer on a grade ``theta`` (positive = uphill) and accelerating
+at ``a_x`` g (negative = braking), every load feels a rearward force
+``w * (a_x + sin(theta))`` at its CG height and a normal force
+``w * cos(theta)``.  Taking moments about the axle contact point, with the
+hitch at height ``h_h`` and ``H = sum(w * h)``::
+
+    T = (cos(theta) * (W * a - M) + (a_x + sin(theta)) * (h_h * W - H) + h_h * F_b) / (a - p)
+
+where ``F_b`` is the rearward ground force from the trailer's own brakes
+(a share of ``-W * a_x`` while braking).  At ``a_x = 0`` on the level this
+is the static result.  Cargo riding above the hitch pitches onto the
+hitch under braking and off it under acceleration or climbing.
+
+:func:`tongue_envelope` evaluates a whole grade x acceleration grid in one
+broadcasted expression, so it is cheap enough to run on every rerun.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+DEFAULT_MAX_BRAKING_G = 0.6
+DEFAULT_MAX_ACCEL_G = 0.3
+DEFAULT_MAX_GRADE_PCT = 6.0
+
+Envelope = namedtuple("Envelope", ["accels", "grades", "tongue_force", "tongue_pct", "lightest", "heaviest"])
+WorstCase = namedtuple("WorstCase", ["tongue_force", "tongue_pct", "accel", "grade"])
+
+
+def dynamic_tongue_force(total_weight, total_moment, height_moment, axle_avg, accel, grade_pct, hitch_height,
+                         hitch_position=0.0, brake_share=0.0):
+    """Tongue force (positive = downward) at ``accel`` g on a ``grade_pct`` % grade.
+
+    ``height_moment`` is ``sum(w * h)`` with heights measured from the
+    ground.  ``brake_share`` is the fraction of the trailer's own
+    deceleration force supplied by its brakes (0 = unbraked).  Broadcasts.
+    """
+    accel = np.asarray(accel, dtype=float)
+    theta = np.arctan(np.asarray(grade_pct, dtype=float) / 100)
+    brake_force = brake_share * total_weight * np.maximum(-accel, 0.0)
+    along = accel + np.sin(theta)
+    return (np.cos(theta) * (total_weight * axle_avg - total_moment)
+            + along * (hitch_height * total_weight - height_moment)
+            + hitch_height * brake_force) / (axle_avg - hitch_position)
+
+
+def _worst(index, accels, grades, force, pct):
+    j, i = np.unravel_index(index, pct.shape)
+    return WorstCase(float(force[j, i]), float(pct[j, i]), float(accels[i]), float(grades[j]))
+
+
+def tongue_envelope(total_weight, total_moment, height_moment, axle_avg, hitch_height, hitch_position=0.0,
+                    brake_share=0.0, max_braking=DEFAULT_MAX_BRAKING_G, max_accel=DEFAULT_MAX_ACCEL_G,
+                    max_grade=DEFAULT_MAX_GRADE_PCT, steps=21):
+    """Tongue force and % over ``steps`` accelerations x ``steps`` grades; returns :class:`Envelope`.
+
+    ``tongue_force``/``tongue_pct`` are ``(grades, accels)`` grids, the
+    percentage taken of the static total weight.  ``lightest`` and
+    ``heaviest`` are :class:`WorstCase` tuples for the extremes.
+    """
+    accels = np.linspace(-max_braking, max_accel, steps)
+    grades = np.linspace(-max_grade, max_grade, steps)
+    force = dynamic_tongue_force(total_weight, total_moment, height_moment, axle_avg, accels[None, :],
+                                 grades[:, None], hitch_height, hitch_position, brake_share)
+    pct = 100 * force / total_weight if total_weight else np.zeros_like(force)
+    return Envelope(accels, grades, force, pct, _worst(np.argmin(force), accels, grades, force, pct),
+                    _worst(np.argmax(force), accels, grades, force, pct))
@@ -0,0 +1,77 @@
+"""Running load totals with O(1) per-row updates.
+
+Editing one row of a large load table only changes that row's contribution
+to the total weight and moment, so :class:`RunningTotals` subtracts the old
+contribution and adds the new one instead of re-summing the table.  Every
+``resum_every`` updates the sums are rebuilt with ``math.fsum`` (exactly
+rounded), which bounds floating-point drift from the running updates.
+
+:func:`editor_changes` finds the edited rows from the edit state that
+``st.data_editor`` keeps in session state, so the app never has to compare
+whole tables.
+"""
+import bisect
+import math
+
+import numpy as np
+
+RESUM_EVERY = 1000
+
+
+class RunningTotals:
+    """Total weight and moment about the hitch of a load table, updated incrementally."""
+
+    def __init__(self, weights=(), cgs=(), resum_every=RESUM_EVERY):
+        self.resum_every = resum_every
+        self.rebuild(weights, cgs)
+
+    def rebuild(self, weights, cgs):
+        """Replace the whole table and re-sum it."""
+        self.weights = np.array(weights, dtype=float)
+        self.cgs = np.array(cgs, dtype=float)
+        self.resum()
+
+    def resum(self):
+        """Recompute both sums exactly from the stored rows."""
+        self.total_weight = math.fsum(self.weights.tolist())
+        self.total_moment = math.fsum((self.weights * self.cgs).tolist())
+        self.updates = 0
+
+    def update(self, index, weight, cg):
+        """Change one row in O(1)."""
+        old_weight, old_cg = self.weights[index], self.cgs[index]
+        self.total_weight += weight - old_weight
+        self.total_moment += weight * cg - old_weight * old_cg
+        self.weights[index], self.cgs[index] = weight, cg
+        self.updates += 1
+        if self.updates >= self.resum_every:
+            self.resum()
+
+    def totals(self):
+        return self.total_weight, self.total_moment
+
+
+def editor_changes(previous, current, num_rows):
+    """Positions of rows edited between two ``st.data_editor`` states, or ``None`` if rows were added or deleted.
+
+    States are the ``{"edited_rows", "added_rows", "deleted_rows"}`` dicts
+    the data editor keeps in session state for a table that started with
+    ``num_rows`` rows.  Positions index the edited table (after deletions,
+    with added rows at the end).  ``None`` also covers a missing
+    ``previous`` state; callers should then rebuild.
+    """
+    if previous is None:
+        return None
+    deleted = sorted(current.get("deleted_rows", []))
+    added = current.get("added_rows", [])
+    if deleted != sorted(previous.get("deleted_rows", [])) or len(added) != len(previous.get("added_rows", [])):
+        return None
+    removed = set(deleted)
+    edited, old_edited = current.get("edited_rows", {}), previous.get("edited_rows", {})
+    positions = [int(row) - bisect.bisect_left(deleted, int(row))
+                 for row in set(edited) | set(old_edited)
+                 if int(row) not in removed and edited.get(row) != old_edited.get(row)]
+    kept = num_rows - len(deleted)
+    positions += [kept + i for i, (row, old_row) in enumerate(zip(added, previous.get("added_rows", [])))
+                  if row != old_row]
+    return sorted(positions)
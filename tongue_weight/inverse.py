@@ -0,0 +1,98 @@
+"""Back-solving unknown weights and CGs from scale readings.
+
+A scale ticket measures the hitch reaction ``T`` and the axle group ``R``.
+Their sum is the total weight and, by moments about the hitch, the total
+moment follows as well::
+
+    W = T + R        M = R * (axle_avg - p) + W * p
+
+Subtracting what is known (cargo weight and moment) leaves the unknown:
+the empty trailer's weight and CG, or the CG of one load of known weight.
+
+:func:`fit_trailer` combines many tickets of the same trailer.  Every
+ticket gives one observation of the trailer weight ``tw`` and one of its
+moment ``tw * tcg``; the least-squares estimates are the per-trailer
+means, computed for all trailers at once with ``np.bincount``.  The CG
+confidence interval comes from the delta method on ``tcg = m / tw``
+(normal approximation, so treat it as rough below ~10 tickets).
+"""
+from collections import namedtuple
+from statistics import NormalDist
+
+import numpy as np
+
+TrailerSolution = namedtuple("TrailerSolution", ["trailer_weight", "trailer_cg"])
+LoadSolution = namedtuple("LoadSolution", ["cg", "weight_residual"])
+TrailerFit = namedtuple("TrailerFit", ["groups", "tickets", "trailer_weight", "trailer_cg", "weight_margin",
+                                       "cg_margin"])
+
+
+def measured_totals(tongue_force, axle_force, axle_avg, hitch_position=0.0):
+    """Total weight and moment about the hitch origin implied by measured reactions."""
+    tongue_force = np.asarray(tongue_force, dtype=float)
+    axle_force = np.asarray(axle_force, dtype=float)
+    total_weight = tongue_force + axle_force
+    span = np.asarray(axle_avg, dtype=float) - hitch_position
+    return total_weight, axle_force * span + total_weight * hitch_position
+
+
+def solve_trailer(tongue_force, axle_force, axle_avg, known_weight=0.0, known_moment=0.0, hitch_position=0.0):
+    """Trailer weight and CG from one set of readings with known cargo; returns :class:`TrailerSolution`.
+
+    The CG is NaN when the inferred trailer weight is zero.
+    """
+    total_weight, total_moment = measured_totals(tongue_force, axle_force, axle_avg, hitch_position)
+    trailer_weight = total_weight - known_weight
+    with np.errstate(divide="ignore", invalid="ignore"):
+        trailer_cg = np.where(trailer_weight != 0, (total_moment - known_moment) / trailer_weight, np.nan)
+    return TrailerSolution(trailer_weight, trailer_cg)
+
+
+def solve_load_cg(tongue_force, axle_force, axle_avg, load_weight, known_weight=0.0, known_moment=0.0,
+                  hitch_position=0.0):
+    """CG of one load of known weight, everything else known; returns :class:`LoadSolution`.
+
+    ``weight_residual`` is the measured total minus the known total
+    (including ``load_weight``); a large residual means the readings or the
+    known weights are off.
+    """
+    total_weight, total_moment = measured_totals(tongue_force, axle_force, axle_avg, hitch_position)
+    load_weight = np.asarray(load_weight, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cg = np.where(load_weight != 0, (total_moment - known_moment) / load_weight, np.nan)
+    return LoadSolution(cg, total_weight - known_weight - load_weight)
+
+
+def fit_trailer(tongue_force, axle_force, axle_avg, known_weight=0.0, known_moment=0.0, hitch_position=0.0,
+                groups=None, confidence=0.95):
+    """Least-squares empty-trailer weight and CG over many tickets; returns :class:`TrailerFit`.
+
+    All inputs are per-ticket arrays (scalars broadcast).  ``groups`` labels
+    which trailer each ticket belongs to (one trailer if omitted); results
+    are arrays ordered like ``groups`` in the fit, which holds the sorted
+    unique labels.  Margins are ± half-widths of the ``confidence`` interval
+    and NaN for trailers with a single ticket.
+    """
+    total_weight, total_moment = measured_totals(tongue_force, axle_force, axle_avg, hitch_position)
+    weight = np.ravel(total_weight - known_weight)
+    moment = np.ravel(np.broadcast_to(total_moment - known_moment, np.shape(total_weight - known_weight)))
+    if groups is None:
+        labels, index = np.zeros(1, dtype=int), np.zeros(len(weight), dtype=int)
+    else:
+        labels, index = np.unique(np.ravel(groups), return_inverse=True)
+
+    count = np.bincount(index, minlength=len(labels)).astype(float)
+    mean_w = np.bincount(index, weight, len(labels)) / count
+    mean_m = np.bincount(index, moment, len(labels)) / count
+    dw, dm = weight - mean_w[index], moment - mean_m[index]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Sample (co)variances of the per-ticket observations, then of their means
+        dof = np.where(count > 1, count - 1, np.nan)
+        var_w = np.bincount(index, dw * dw, len(labels)) / dof / count
+        var_m = np.bincount(index, dm * dm, len(labels)) / dof / count
+        cov = np.bincount(index, dw * dm, len(labels)) / dof / count
+        cg = mean_m / mean_w
+        var_cg = (var_m - 2 * cg * cov + cg * cg * var_w) / (mean_w * mean_w)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return TrailerFit(labels, count.astype(int), mean_w, cg, z * np.sqrt(var_w),
+                      z * np.sqrt(np.maximum(var_cg, 0.0)))
@@ -0,0 +1,52 @@
+"""Left/right wheel loads from lateral load offsets (plan-view loading).
+
+Each load may sit ``offset`` inches off the trailer centreline, positive to
+the right (curb side) when facing forward.  The ball coupler is free to
+roll, so the hitch takes its share on the centreline and the axles carry
+the whole roll moment ``L = sum(w * offset)``.  The axles share it in
+proportion to their vertical reactions, i.e. each axle sees the same
+lateral CG ``ybar = L / sum(R)``, and with track width ``t``::
+
+    right = R * (1/2 + ybar / t)      left = R * (1/2 - ybar / t)
+
+A negative wheel load means that side lifts off.  Functions broadcast like
+:mod:`tongue_weight.axles`: scalars for one scenario or ``(N,)`` moments
+with ``(N, A)`` NaN-padded reactions for a batch.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+DEFAULT_TRACK_WIDTH = 80.0
+
+WheelLoads = namedtuple("WheelLoads", ["left", "right", "left_total", "right_total", "lateral_cg"])
+
+
+def lateral_moment(weights, offsets):
+    """Roll moment ``sum(w * offset)`` about the centreline (lbs·in, positive = right side heavy)."""
+    return np.einsum("...k,...k->...", np.asarray(weights, dtype=float), np.asarray(offsets, dtype=float))
+
+
+def wheel_loads(reactions, roll_moment, track_width=DEFAULT_TRACK_WIDTH, wheels_per_side=1):
+    """Per-wheel loads for each axle and per-side totals; returns :class:`WheelLoads`.
+
+    ``reactions`` are the axle reactions from
+    :func:`tongue_weight.axles.axle_reactions`.  ``left``/``right`` are per
+    wheel (divided by ``wheels_per_side`` for dual wheels) and shaped like
+    ``reactions``; the totals sum both over all axles.  ``lateral_cg`` is
+    NaN when the axles carry no load.
+    """
+    reactions = np.asarray(reactions, dtype=float)
+    axle_total = np.nansum(reactions, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lateral_cg = np.where(axle_total != 0, np.asarray(roll_moment, dtype=float) / axle_total, np.nan)
+    share = np.nan_to_num(lateral_cg)[..., None] / track_width
+    right_side = reactions * (0.5 + share)
+    left_side = reactions * (0.5 - share)
+    return WheelLoads(
+        left=left_side / wheels_per_side,
+        right=right_side / wheels_per_side,
+        left_total=np.nansum(left_side, axis=-1),
+        right_total=np.nansum(right_side, axis=-1),
+        lateral_cg=lateral_cg,
+    )
@@ -0,0 +1,58 @@
+"""Columnar load table backed by NumPy arrays.
+
+The app edits loads as a table that can hold thousands of rows.  Keeping
+weights and CGs as parallel float arrays makes the totals a pair of
+vectorized reductions instead of Python loops over tuples.  Optional
+``offsets`` and ``heights`` columns hold each load's lateral position for
+plan-view loading (see :mod:`tongue_weight.lateral`) and its CG height
+above the ground for dynamic loads (see :mod:`tongue_weight.dynamic`).
+"""
+import numpy as np
+
+from .lateral import lateral_moment
+
+
+class LoadTable:
+    """Parallel ``weights`` (lbs), ``cgs`` (in from hitch), ``offsets`` (in, + = right) and ``heights`` (in)."""
+
+    def __init__(self, weights=(), cgs=(), offsets=None, heights=None):
+        self.weights = np.asarray(weights, dtype=float).ravel()
+        self.cgs = np.asarray(cgs, dtype=float).ravel()
+        self.offsets = np.zeros_like(self.weights) if offsets is None else np.asarray(offsets, dtype=float).ravel()
+        self.heights = np.zeros_like(self.weights) if heights is None else np.asarray(heights, dtype=float).ravel()
+        if not self.weights.shape == self.cgs.shape == self.offsets.shape == self.heights.shape:
+            raise ValueError("weights, cgs, offsets and heights must have the same length")
+
+    @classmethod
+    def from_columns(cls, weights, cgs, offsets=None, heights=None):
+        """Build from editor columns, dropping rows without a weight and treating other blanks as 0."""
+        weights = np.asarray(weights, dtype=float)
+        column = lambda values: (np.zeros_like(weights) if values is None  # noqa: E731
+                                 else np.nan_to_num(np.asarray(values, dtype=float)))
+        keep = ~np.isnan(weights)
+        return cls(weights[keep], column(cgs)[keep], column(offsets)[keep], column(heights)[keep])
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __iter__(self):
+        return zip(self.weights.tolist(), self.cgs.tolist())
+
+    def with_trailer(self, trailer_weight=0, trailer_cg=0, trailer_height=0):
+        """Return a table with the trailer structure (on the centreline) appended when it has weight."""
+        if trailer_weight > 0:
+            return LoadTable(np.append(self.weights, trailer_weight), np.append(self.cgs, trailer_cg),
+                             np.append(self.offsets, 0.0), np.append(self.heights, trailer_height))
+        return self
+
+    def totals(self):
+        """Total weight and total moment about the hitch."""
+        return float(self.weights.sum()), float(self.weights @ self.cgs)
+
+    def lateral_moment(self):
+        """Roll moment about the trailer centreline."""
+        return float(lateral_moment(self.weights, self.offsets))
+
+    def height_moment(self):
+        """Sum of weight times CG height."""
+        return float(self.weights @ self.heights)
@@ -0,0 +1,110 @@
+"""Monte Carlo propagation of weight and CG tolerances to tongue percentage.
+
+Each load (including the trailer structure, if given) gets a normal weight
+and CG distribution.  Samples are drawn in chunks and reduced to running
+aggregates (moments, band counts and a fixed-edge histogram), so memory is
+bounded by the chunk size rather than the sample count.  Chunks can be
+spread over a process pool; each chunk has its own spawned seed, so results
+are reproducible for a given ``seed`` regardless of the worker count.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .core import TONGUE_PCT_HIGH, TONGUE_PCT_LOW, axle_average
+
+# Upper bound on samples x loads held in memory per chunk
+CHUNK_ELEMENTS = 4_000_000
+HIST_BINS = 400
+
+MonteCarloSummary = namedtuple(
+    "MonteCarloSummary",
+    ["samples", "mean", "std", "p5", "p50", "p95", "p_low", "p_high", "p_out", "hist_counts", "hist_edges"],
+)
+
+
+def sample_tongue_pct(weights, cgs, weight_sd, cg_sd, axle_avg, n, rng, hitch_position=0.0):
+    """Draw ``n`` tongue percentages; weights are clipped at zero."""
+    shape = (n, len(weights))
+    w = np.maximum(weights + weight_sd * rng.standard_normal(shape), 0.0)
+    c = cgs + cg_sd * rng.standard_normal(shape)
+    total_weight = w.sum(axis=1)
+    total_moment = np.einsum("ij,ij->i", w, c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(total_weight > 0, 100 * (total_weight * axle_avg - total_moment)
+                       / ((axle_avg - hitch_position) * total_weight), 0.0)
+    return pct
+
+
+def _chunk_stats(args):
+    weights, cgs, weight_sd, cg_sd, axle_avg, hitch_position, n, seed, edges, low, high = args
+    pct = sample_tongue_pct(weights, cgs, weight_sd, cg_sd, axle_avg, n, np.random.default_rng(seed), hitch_position)
+    counts, _ = np.histogram(np.clip(pct, edges[0], edges[-1]), bins=edges)
+    return pct.sum(), (pct * pct).sum(), int((pct < low).sum()), int((pct > high).sum()), counts
+
+
+def _percentile(counts, edges, q):
+    cumulative = np.cumsum(counts)
+    target = q / 100 * cumulative[-1]
+    i = int(np.searchsorted(cumulative, target))
+    before = cumulative[i - 1] if i else 0
+    frac = (target - before) / counts[i] if counts[i] else 0.0
+    return float(edges[i] + frac * (edges[i + 1] - edges[i]))
+
+
+def simulate(weights, cgs, axle_positions, weight_sd=0.0, cg_sd=0.0, samples=1_000_000, seed=None,
+             workers=1, low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, bins=HIST_BINS, hitch_position=0.0):
+    """Summarize the tongue percentage distribution over ``samples`` draws.
+
+    ``weight_sd`` and ``cg_sd`` are one standard deviation per load (scalars
+    or arrays matching ``weights``).  Percentiles are interpolated from the
+    histogram; mean, std and band probabilities are exact.
+    """
+    weights = np.asarray(weights, dtype=float)
+    cgs = np.asarray(cgs, dtype=float)
+    weight_sd = np.broadcast_to(np.asarray(weight_sd, dtype=float), weights.shape)
+    cg_sd = np.broadcast_to(np.asarray(cg_sd, dtype=float), weights.shape)
+    axle_avg = axle_average(axle_positions)
+
+    chunk = max(1, min(samples, CHUNK_ELEMENTS // max(len(weights), 1)))
+    sizes = [chunk] * (samples // chunk) + ([samples % chunk] if samples % chunk else [])
+    pilot_seed, *chunk_seeds = np.random.SeedSequence(seed).spawn(len(sizes) + 1)
+
+    # A small pilot run fixes the histogram edges shared by every chunk
+    pilot = sample_tongue_pct(weights, cgs, weight_sd, cg_sd, axle_avg, 10_000, np.random.default_rng(pilot_seed),
+                              hitch_position)
+    lo, hi = np.percentile(pilot, [0.01, 99.99])
+    pad = max(hi - lo, 1e-6)
+    edges = np.linspace(min(lo - pad, low - 1), max(hi + pad, high + 1), bins + 1)
+
+    tasks = [(weights, cgs, weight_sd, cg_sd, axle_avg, hitch_position, n, s, edges, low, high)
+             for n, s in zip(sizes, chunk_seeds)]
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_chunk_stats, tasks))
+    else:
+        parts = [_chunk_stats(t) for t in tasks]
+
+    total = sum(p[0] for p in parts)
+    total_sq = sum(p[1] for p in parts)
+    n_low = sum(p[2] for p in parts)
+    n_high = sum(p[3] for p in parts)
+    counts = np.sum([p[4] for p in parts], axis=0)
+
+    mean = total / samples
+    std = float(np.sqrt(max(total_sq / samples - mean * mean, 0.0)))
+    return MonteCarloSummary(
+        samples=samples,
+        mean=float(mean),
+        std=std,
+        p5=_percentile(counts, edges, 5),
+        p50=_percentile(counts, edges, 50),
+        p95=_percentile(counts, edges, 95),
+        p_low=n_low / samples,
+        p_high=n_high / samples,
+        p_out=(n_low + n_high) / samples,
+        hist_counts=counts,
+        hist_edges=edges,
+    )
@@ -0,0 +1,107 @@
+"""Move loads so the tongue percentage lands on a target.
+
+The tongue weight is linear in the load moment,
+``T = (W * axle_avg - M) / (axle_avg - hitch_position)``, so hitting
+``target_pct`` requires ``M* = W * axle_avg - target_pct / 100 * W * (axle_avg - hitch_position)``.
+Moving a load of weight ``w`` by ``d`` changes ``M`` by ``w * d``, which gives
+
+* a closed form for shifting any single load (:func:`single_load_shifts`);
+* for spreading the change over several loads with the least total
+  squared movement, ``d_i = clip(lam * w_i, lo_i, hi_i)``, where ``lam`` is
+  found by a vectorized bisection (:func:`rebalance_loads`).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .core import axle_average
+
+DEFAULT_TARGET_PCT = 12.5
+
+Placement = namedtuple("Placement", ["cgs", "shifts", "tongue_pct", "feasible"])
+
+
+def target_moment(total_weight, axle_avg, target_pct=DEFAULT_TARGET_PCT, hitch_position=0.0):
+    """Total moment that gives ``target_pct`` tongue weight."""
+    return total_weight * axle_avg - target_pct / 100 * total_weight * (axle_avg - hitch_position)
+
+
+def _tongue_pct(weights, cgs, axle_avg, hitch_position):
+    total_weight = weights.sum()
+    if total_weight == 0:
+        return 0.0
+    return float(100 * (total_weight * axle_avg - weights @ cgs) / ((axle_avg - hitch_position) * total_weight))
+
+
+def single_load_shifts(weights, cgs, axle_positions, target_pct=DEFAULT_TARGET_PCT, lower=-np.inf, upper=np.inf,
+                       hitch_position=0.0):
+    """Shift of each load, on its own, that hits ``target_pct``.
+
+    Returns ``(shifts, feasible)`` arrays: ``shifts[i]`` is the clamped move
+    of load ``i`` and ``feasible[i]`` says whether the clamped move actually
+    reaches the target.  Zero-weight loads are never feasible.
+    """
+    weights = np.asarray(weights, dtype=float)
+    cgs = np.asarray(cgs, dtype=float)
+    delta = target_moment(weights.sum(), axle_average(axle_positions), target_pct, hitch_position) - weights @ cgs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wanted = np.where(weights != 0, delta / weights, np.nan)
+    shifts = np.clip(np.nan_to_num(wanted), lower - cgs, upper - cgs)
+    feasible = np.isclose(shifts, wanted, rtol=1e-9, atol=1e-9)
+    return shifts, feasible
+
+
+def rebalance_loads(weights, cgs, axle_positions, target_pct=DEFAULT_TARGET_PCT, movable=None,
+                    lower=-np.inf, upper=np.inf, tol=1e-9, max_iter=200, hitch_position=0.0):
+    """Move the ``movable`` loads as little as possible (least squares) to hit ``target_pct``.
+
+    ``lower``/``upper`` bound the new CGs (scalars or per-load arrays).  If
+    the bounds make the target unreachable the loads are pushed as far as
+    they can go and ``feasible`` is False.
+    """
+    weights = np.asarray(weights, dtype=float)
+    cgs = np.asarray(cgs, dtype=float)
+    axle_avg = axle_average(axle_positions)
+    movable = np.ones(weights.shape, bool) if movable is None else np.asarray(movable, bool)
+
+    lo = np.where(movable, np.broadcast_to(lower, cgs.shape) - cgs, 0.0)
+    hi = np.where(movable, np.broadcast_to(upper, cgs.shape) - cgs, 0.0)
+    w = np.where(movable, weights, 0.0)
+    delta = target_moment(weights.sum(), axle_avg, target_pct, hitch_position) - weights @ cgs
+
+    def moment_change(lam):
+        return w @ np.clip(lam * w, lo, hi)
+
+    scale = w @ w
+    if scale == 0:
+        shifts = np.zeros_like(cgs)
+    else:
+        # Unconstrained optimum first; bisection only when it violates a bound
+        lam = delta / scale
+        shifts = lam * w
+        if np.any(shifts < lo) or np.any(shifts > hi):
+            a, b = sorted((0.0, lam))
+            while moment_change(b) < delta and b < 1e12:
+                b = b * 2 + 1
+            while moment_change(a) > delta and a > -1e12:
+                a = a * 2 - 1
+            for _ in range(max_iter):
+                mid = 0.5 * (a + b)
+                if moment_change(mid) < delta:
+                    a = mid
+                else:
+                    b = mid
+                if b - a <= tol * max(abs(a), abs(b)):
+                    break
+            # The clipped set is fixed inside the final bracket, so solve the free loads exactly
+            lam = 0.5 * (a + b)
+            shifts = np.clip(lam * w, lo, hi)
+            free = (lam * w > lo) & (lam * w < hi)
+            free_scale = w[free] @ w[free]
+            if free_scale > 0:
+                lam = (delta - w[~free] @ shifts[~free]) / free_scale
+                shifts = np.clip(lam * w, lo, hi)
+
+    new_cgs = cgs + shifts
+    pct = _tongue_pct(weights, new_cgs, axle_avg, hitch_position)
+    return Placement(new_cgs, shifts, pct, bool(abs(pct - target_pct) < 1e-6))
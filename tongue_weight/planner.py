@@ -0,0 +1,157 @@
+"""Cargo arrangement planner.
+
+Items with a weight and a length are laid end to end on the deck, in some
+order, as one block starting at ``start``.  For a given order the block's
+own moment about its front edge is ``m = sum(w_k * (offset_k + len_k / 2))``,
+and sliding the block changes the total moment linearly, so the best start
+for an order is a closed form clamped to the deck.  Planning therefore
+reduces to choosing an order whose ``m`` lets the clamped start reach the
+target moment:
+
+* the order by decreasing weight per inch minimizes ``m`` (exchange
+  argument), its reverse maximizes it, and adjacent swaps walk between the
+  two in small steps (greedy);
+* pairwise swaps evaluated for all pairs at once then polish the order
+  (local search);
+* ``exact=True`` enumerates every order for small item counts.
+
+The target moment is the requested tongue percentage clamped to the
+tongue band and to the axle group rating (equalized axles).  With the
+hitch at ``hitch_position`` the axle group carries ``(M - W * p) / (a - p)``.
+"""
+import itertools
+from collections import namedtuple
+
+import numpy as np
+
+from .core import TONGUE_PCT_HIGH, TONGUE_PCT_LOW, axle_average
+
+DEFAULT_TARGET_PCT = 12.5
+MAX_EXACT_ITEMS = 8
+
+Plan = namedtuple("Plan", ["order", "starts", "ends", "cgs", "tongue_force", "tongue_pct", "axle_load", "feasible"])
+
+
+def _block_moment(weights, lengths, order):
+    w, l = weights[order], lengths[order]
+    offsets = np.cumsum(l) - l
+    return float(w @ (offsets + l / 2))
+
+
+def _swap_deltas(weights, lengths, order):
+    # Change of block moment for swapping positions i < j, for all pairs at once
+    w, l = weights[order], lengths[order]
+    offsets = np.cumsum(l) - l
+    cum_w = np.concatenate(([0.0], np.cumsum(w)))
+    i, j = np.triu_indices(len(order), k=1)
+    between = cum_w[j] - cum_w[i + 1]
+    dl = l[j] - l[i]
+    delta = (w[j] - w[i]) * (offsets[i] - offsets[j]) + w[i] * dl + dl * between
+    return i, j, delta
+
+
+def _distance(m, lo, hi):
+    return np.maximum(lo - m, 0.0) + np.maximum(m - hi, 0.0)
+
+
+def plan_cargo(weights, lengths, axle_positions, deck_start=0.0, deck_end=None, base_weight=0.0,
+               base_moment=0.0, target_pct=DEFAULT_TARGET_PCT, axle_group_rating=None,
+               low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, exact=False, max_passes=50,
+               hitch_position=0.0):
+    """Place items on ``[deck_start, deck_end]`` without overlap; returns a :class:`Plan`.
+
+    ``base_weight``/``base_moment`` cover loads already on the trailer.
+    ``feasible`` is True when the items fit, the tongue percentage is in
+    band and the axle group load is within ``axle_group_rating``.
+    """
+    weights = np.asarray(weights, dtype=float)
+    lengths = np.asarray(lengths, dtype=float)
+    n = len(weights)
+    if deck_end is None:
+        raise ValueError("deck_end is required")
+    axle_avg = axle_average(axle_positions)
+    span = axle_avg - hitch_position
+    total_weight = base_weight + weights.sum()
+    block_weight = weights.sum()
+    slack = (deck_end - deck_start) - lengths.sum()
+    fits = slack >= 0
+
+    # Target total moment, clamped to the band and the axle rating
+    moment_for = lambda pct: total_weight * (axle_avg - span * pct / 100)  # noqa: E731
+    m_lo, m_hi = moment_for(high), moment_for(low)
+    if axle_group_rating is not None:
+        m_hi = min(m_hi, axle_group_rating * span + total_weight * hitch_position)
+    goal = min(max(moment_for(target_pct), m_lo), max(m_hi, m_lo))
+
+    # Block moments that let some start position reach the goal
+    start_lo, start_hi = deck_start, deck_start + max(slack, 0.0)
+    want_lo = goal - base_moment - block_weight * start_hi
+    want_hi = goal - base_moment - block_weight * start_lo
+
+    if n == 0:
+        order = np.arange(0)
+    elif exact and n <= MAX_EXACT_ITEMS:
+        perms = np.array(list(itertools.permutations(range(n))))
+        w, l = weights[perms], lengths[perms]
+        m = ((np.cumsum(l, axis=1) - l / 2) * w).sum(axis=1)
+        order = perms[int(np.argmin(_distance(m, want_lo, want_hi)))]
+    else:
+        order = _greedy_order(weights, lengths, want_lo, want_hi)
+        order = _local_search(weights, lengths, order, want_lo, want_hi, max_passes)
+
+    m = _block_moment(weights, lengths, order) if n else 0.0
+    start = (goal - base_moment - m) / block_weight if block_weight else deck_start
+    start = min(max(start, start_lo), start_hi)
+
+    l = lengths[order]
+    starts = np.empty(n)
+    starts[order] = start + np.cumsum(l) - l
+    ends = starts + lengths
+    cgs = starts + lengths / 2
+
+    total_moment = base_moment + weights @ cgs
+    axle_load = (total_moment - total_weight * hitch_position) / span
+    tongue_force = total_weight - axle_load
+    pct = 100 * tongue_force / total_weight if total_weight else 0.0
+    feasible = bool(fits and total_weight and low <= pct <= high
+                    and (axle_group_rating is None or axle_load <= axle_group_rating))
+    return Plan(list(map(int, order)), starts, ends, cgs, tongue_force, pct, axle_load, feasible)
+
+
+def _greedy_order(weights, lengths, want_lo, want_hi):
+    # Start from the minimum-moment order and bubble towards its reverse until m enters the window
+    density = weights / np.where(lengths > 0, lengths, 1e-12)
+    order = list(np.argsort(-density, kind="stable"))
+    m = _block_moment(weights, lengths, order)
+    if m >= want_lo:
+        return np.array(order)
+    n = len(order)
+    for end in range(n - 1, 0, -1):
+        for k in range(end):
+            a, b = order[k], order[k + 1]
+            # Swapping adjacent items a (front) and b moves a back by len_b and b forward by len_a
+            delta = weights[a] * lengths[b] - weights[b] * lengths[a]
+            if delta <= 0:
+                continue
+            order[k], order[k + 1] = b, a
+            m += delta
+            if m >= want_lo:
+                return np.array(order)
+    return np.array(order)
+
+
+def _local_search(weights, lengths, order, want_lo, want_hi, max_passes):
+    order = np.array(order)
+    m = _block_moment(weights, lengths, order)
+    for _ in range(max_passes):
+        current = _distance(m, want_lo, want_hi)
+        if current == 0 or len(order) < 2:
+            break
+        i, j, delta = _swap_deltas(weights, lengths, order)
+        scores = _distance(m + delta, want_lo, want_hi)
+        best = int(np.argmin(scores))
+        if scores[best] >= current - 1e-9:
+            break
+        order[i[best]], order[j[best]] = order[j[best]], order[i[best]]
+        m += delta[best]
+    return order
@@ -0,0 +1,246 @@
+"""Trailer layout diagram drawn with the object-oriented matplotlib API.
+
+Nothing here touches ``matplotlib.pyplot``, so figures never enter pyplot's
+global registry.  :func:`render_layout` reuses one figure per thread and
+clears it after every render, which keeps memory flat across Streamlit
+reruns.  :func:`cached_layout` adds a process-wide LRU cache on top, so
+identical scenarios across reruns and sessions reuse the same image.
+"""
+import io
+import threading
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from .cache import LRUCache
+
+FIGSIZE = (10, 3)
+PLAN_FIGSIZE = (10, 4)
+
+# Above this many loads, markers are binned along the deck instead of drawn one by one
+MAX_LOAD_MARKERS = 12
+LOAD_BINS = 60
+
+_local = threading.local()
+
+# Drop the <metadata> block (and its timestamp) so SVG output is deterministic
+SVG_METADATA = {"Date": None, "Creator": None, "Format": None, "Type": None}
+
+layout_cache = LRUCache(max_entries=256, ttl=3600)
+
+
+def draw_layout(ax, trailer_length, axle_positions, loads, tongue_force_display, distributed=(),
+                hitch_position=0.0):
+    """Draw hitch, axles, virtual axle, point loads and distributed loads onto ``ax``.
+
+    ``distributed`` holds ``(start, end, q_start, q_end)`` segments.  A
+    nonzero ``hitch_position`` marks a fifth-wheel or gooseneck pin.
+    """
+    axle_avg = sum(axle_positions) / len(axle_positions)
+
+    ax.set_xlim(0, trailer_length)
+    ax.set_ylim(-1.5, 1.5)
+    ax.get_yaxis().set_visible(False)
+    if hitch_position:
+        ax.set_xlabel("Distance from Trailer Front (in)")
+        ax.plot(hitch_position, 0, "r^", markersize=9,
+                label=f"Pin Weight: {tongue_force_display:.0f} lbs ({hitch_position:.0f} in)")
+    else:
+        ax.set_xlabel("Distance from Hitch (in)")
+        # Tongue weight dot at 0
+        ax.plot(0, 0, "ro", label=f"Tongue Weight: {tongue_force_display:.0f} lbs (0 in)")
+
+    # Plot real axles
+    for i, pos in enumerate(axle_positions):
+        ax.axvline(pos, color='gray', linestyle='--', label=f"Axle {i+1}: {pos:.0f} in")
+
+    # Plot virtual axle (avg)
+    ax.axvline(axle_avg, color='blue', linestyle=':', label=f"Virtual Axle: {axle_avg:.1f} in")
+
+    # Plot loads (dots only, labels in legend)
+    loads = list(loads)
+    if len(loads) <= MAX_LOAD_MARKERS:
+        for i, (w, cg) in enumerate(loads):
+            ax.plot(cg, 0, "go", label=f"Load {i+1}: {w:.0f} lbs at {cg:.0f} in")
+    else:
+        _draw_binned_loads(ax, loads, trailer_length)
+
+    # Distributed loads as shaded intensity profiles above the deck line
+    distributed = list(distributed)
+    if distributed:
+        q_max = max(max(abs(q0), abs(q1)) for _, _, q0, q1 in distributed) or 1.0
+        for i, (start, end, q0, q1) in enumerate(distributed):
+            weight = 0.5 * (end - start) * (q0 + q1)
+            if len(distributed) <= MAX_LOAD_MARKERS:
+                label = f"Distributed {i+1}: {weight:.0f} lbs, {start:.0f}–{end:.0f} in"
+            else:
+                label = f"{len(distributed)} Distributed Loads" if i == 0 else None
+            ax.fill_between([start, end], 0.25, [0.25 + q0 / q_max, 0.25 + q1 / q_max],
+                            color="tab:brown", alpha=0.35, label=label)
+
+    # Legend beside plot
+    ax.legend(loc='center left', bbox_to_anchor=(1, 0.5), frameon=False)
+
+
+def _draw_binned_loads(ax, loads, trailer_length):
+    # Sum weight and moment per bin and draw one marker per bin at its CG, sized by weight
+    weights, cgs = np.asarray(loads, dtype=float).T
+    lo, hi = min(0.0, cgs.min()), max(float(trailer_length), cgs.max())
+    bin_weight, _ = np.histogram(cgs, bins=LOAD_BINS, range=(lo, hi), weights=weights)
+    bin_moment, _ = np.histogram(cgs, bins=LOAD_BINS, range=(lo, hi), weights=weights * cgs)
+    mask = bin_weight != 0
+    centers = bin_moment[mask] / bin_weight[mask]
+    sizes = 15 + 200 * np.abs(bin_weight[mask]) / np.abs(bin_weight[mask]).max()
+    ax.scatter(centers, np.zeros_like(centers), s=sizes, color="green", alpha=0.6,
+               label=f"{len(loads)} Loads: {weights.sum():.0f} lbs (binned)")
+
+
+def _thread_figure(figsize):
+    figures = getattr(_local, "figures", None)
+    if figures is None:
+        figures = _local.figures = {}
+    fig = figures.get(figsize)
+    if fig is None:
+        fig = figures[figsize] = Figure(figsize=figsize)
+    return fig
+
+
+def render_figure(draw, figsize=FIGSIZE, fmt="png", dpi=100):
+    """Call ``draw(fig)`` on this thread's reusable figure of ``figsize`` and return image bytes."""
+    fig = _thread_figure(tuple(figsize))
+    try:
+        draw(fig)
+        buf = io.BytesIO()
+        metadata = SVG_METADATA if fmt == "svg" else None
+        fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight', metadata=metadata)
+        return buf.getvalue()
+    finally:
+        fig.clear()
+
+
+def render_layout(trailer_length, axle_positions, loads, tongue_force_display, fmt="png", dpi=100,
+                  distributed=(), hitch_position=0.0):
+    """Render the layout to image bytes on this thread's reusable figure."""
+    return render_figure(
+        lambda fig: draw_layout(fig.subplots(), trailer_length, axle_positions, loads, tongue_force_display,
+                                distributed, hitch_position),
+        FIGSIZE, fmt, dpi)
+
+
+def layout_key(trailer_length, axle_positions, loads, tongue_force_display, fmt="png", dpi=100, distributed=(),
+               hitch_position=0.0):
+    """Hashable cache key for a rendered layout."""
+    return (float(trailer_length), tuple(float(p) for p in axle_positions),
+            np.asarray(list(loads), dtype=float).tobytes(), float(tongue_force_display), fmt, dpi,
+            np.asarray(list(distributed), dtype=float).tobytes(), float(hitch_position))
+
+
+def cached_layout(trailer_length, axle_positions, loads, tongue_force_display, fmt="png", dpi=100,
+                  distributed=(), hitch_position=0.0):
+    """Like :func:`render_layout`, memoized in :data:`layout_cache`."""
+    key = layout_key(trailer_length, axle_positions, loads, tongue_force_display, fmt, dpi, distributed,
+                     hitch_position)
+    return layout_cache.get_or_compute(
+        key, lambda: render_layout(trailer_length, axle_positions, loads, tongue_force_display, fmt, dpi,
+                                   distributed, hitch_position))
+
+
+def draw_plan_view(ax, trailer_length, deck_width, axle_positions, loads, track_width, left, right,
+                   hitch_position=0.0):
+    """Top-down view: deck outline, loads sized by weight, and per-wheel loads on each axle.
+
+    ``loads`` is ``(weights, cgs, offsets)``; ``left``/``right`` are per-wheel
+    loads per axle from :func:`tongue_weight.lateral.wheel_loads`.  The
+    positive offset (right side) is drawn at the top.
+    """
+    weights, cgs, offsets = (np.asarray(v, dtype=float) for v in loads)
+    half = deck_width / 2
+    ax.plot([0, trailer_length, trailer_length, 0, 0], [-half, -half, half, half, -half], color="black", linewidth=1)
+    ax.plot(hitch_position, 0, "r^" if hitch_position else "ro", markersize=8, label="Hitch")
+    ax.axhline(0, color="gray", linewidth=0.5, linestyle=":")
+
+    for i, pos in enumerate(axle_positions):
+        ax.plot([pos, pos], [-track_width / 2, track_width / 2], color="gray", linestyle="--")
+        for side, y, va in ((right[i], track_width / 2, "bottom"), (left[i], -track_width / 2, "top")):
+            ax.plot(pos, y, "ks", markersize=7, markerfacecolor="red" if side < 0 else "dimgray")
+            ax.annotate(f"{side:.0f}", (pos, y), textcoords="offset points", xytext=(0, 6 if va == "bottom" else -6),
+                        ha="center", va=va, fontsize=8)
+
+    if len(weights) and np.abs(weights).max() > 0:
+        sizes = 15 + 300 * np.abs(weights) / np.abs(weights).max()
+        ax.scatter(cgs, offsets, s=sizes, color="green", alpha=0.5,
+                   label=f"{len(weights)} Loads: {weights.sum():.0f} lbs")
+        total = weights.sum()
+        if total:
+            ax.plot(weights @ cgs / total, weights @ offsets / total, "kx", markersize=9,
+                    label="Combined CG")
+
+    ax.set_xlim(min(0.0, float(np.min(cgs, initial=0.0))) - 5,
+                max(float(trailer_length), float(np.max(cgs, initial=0.0))) + 5)
+    reach = max(half, track_width / 2, float(np.abs(offsets).max(initial=0.0)))
+    ax.set_ylim(-reach * 1.35, reach * 1.35)
+    ax.set_aspect("equal")
+    ax.set_xlabel("Distance from Hitch (in)" if not hitch_position else "Distance from Trailer Front (in)")
+    ax.set_ylabel("Lateral Offset (in, + = right)")
+    ax.legend(loc='center left', bbox_to_anchor=(1, 0.5), frameon=False)
+
+
+def cached_plan_view(trailer_length, deck_width, axle_positions, loads, track_width, left, right,
+                     hitch_position=0.0, fmt="png", dpi=100):
+    """Render :func:`draw_plan_view` to image bytes, memoized in :data:`layout_cache`."""
+    key = ("plan", float(trailer_length), float(deck_width), tuple(float(p) for p in axle_positions),
+           np.asarray(loads, dtype=float).tobytes(), float(track_width),
+           np.asarray(left, dtype=float).round(1).tobytes(), np.asarray(right, dtype=float).round(1).tobytes(),
+           float(hitch_position), fmt, dpi)
+    return layout_cache.get_or_compute(key, lambda: render_figure(
+        lambda fig: draw_plan_view(fig.subplots(), trailer_length, deck_width, axle_positions, loads, track_width,
+                                   left, right, hitch_position),
+        PLAN_FIGSIZE, fmt, dpi))
+
+
+def draw_tornado(ax, labels, low, high, base, xlabel="Tongue Weight (%)"):
+    """Horizontal tornado chart: bars from ``base`` to ``low`` and ``high`` per input, top = largest."""
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    y = np.arange(len(labels))[::-1]
+    ax.barh(y, low - base, left=base, color="tab:blue", label="Input decreased")
+    ax.barh(y, high - base, left=base, color="tab:orange", label="Input increased")
+    ax.axvline(base, color="black", linewidth=0.8)
+    ax.set_yticks(y, labels)
+    ax.set_xlabel(xlabel)
+    ax.legend(loc='center left', bbox_to_anchor=(1, 0.5), frameon=False)
+
+
+def cached_tornado(labels, low, high, base, xlabel="Tongue Weight (%)", fmt="png", dpi=100):
+    """Render :func:`draw_tornado` to image bytes, memoized in :data:`layout_cache`."""
+    figsize = (10, 0.4 * len(labels) + 1.2)
+    key = ("tornado", tuple(labels), np.asarray(low, dtype=float).tobytes(), np.asarray(high, dtype=float).tobytes(),
+           float(base), xlabel, fmt, dpi)
+    return layout_cache.get_or_compute(key, lambda: render_figure(
+        lambda fig: draw_tornado(fig.subplots(), labels, low, high, base, xlabel), figsize, fmt, dpi))
+
+
+def draw_heatmap(fig, xs, ys, values, xlabel, ylabel, low, high, label="Tongue Weight (%)"):
+    """Heatmap of ``values[y, x]`` with the ``low``/``high`` band outlined."""
+    ax = fig.subplots()
+    extent = (xs[0], xs[-1], ys[0], ys[-1])
+    image = ax.imshow(values, origin="lower", extent=extent, aspect="auto", cmap="viridis",
+                      interpolation="nearest")
+    fig.colorbar(image, ax=ax, label=label)
+    if len(xs) > 1 and len(ys) > 1:
+        contours = ax.contour(xs, ys, values, levels=[low, high], colors="white", linewidths=1.5)
+        ax.clabel(contours, fmt="%g%%")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+
+def cached_heatmap(key, compute, xlabel, ylabel, low, high, label="Tongue Weight (%)", figsize=(8, 5), fmt="png",
+                   dpi=100):
+    """Render :func:`draw_heatmap` of ``compute()`` (an ``(xs, ys, values)`` triple), memoized in :data:`layout_cache`.
+
+    ``compute`` only runs on a cache miss, so ``key`` must identify the data
+    it returns (e.g. the sweep engine's key, parameters, ranges and steps).
+    """
+    key = ("heatmap", key, xlabel, ylabel, float(low), float(high), label, tuple(figsize), fmt, dpi)
+    return layout_cache.get_or_compute(key, lambda: render_figure(
+        lambda fig: draw_heatmap(fig, *compute(), xlabel, ylabel, low, high, label), figsize, fmt, dpi))
@@ -0,0 +1,55 @@
+"""In-memory PDF reports.
+
+Reports are built entirely in memory: the layout plot is embedded as SVG
+(vector, so it stays sharp at any zoom and adds only a few kB) and the PDF is
+returned as bytes, ready for ``st.download_button`` or writing to disk.
+"""
+import io
+
+from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+
+TITLE = "Trailer Tongue Weight Report"
+
+ASSUMPTIONS = (
+    "- All axles treated as a single point load at average position.\n"
+    "- Loads treated as point forces at CGs; distributed loads integrated exactly.\n"
+    "- Trailer weight & CG are optional.\n"
+    "- Positive tongue weight = downward force at hitch."
+)
+
+HITCH_NAMES = {"bumper": "Bumper pull", "gooseneck": "Gooseneck", "fifth_wheel": "Fifth wheel"}
+
+
+def new_document():
+    pdf = FPDF()
+    pdf.set_title(TITLE)
+    return pdf
+
+
+def _line(pdf, text):
+    pdf.cell(200, 10, text=text, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+
+def add_report_page(pdf, result, plot_svg, title=TITLE, hitch_type="bumper"):
+    """Append one report page for a :class:`~tongue_weight.core.TongueResult`."""
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=12)
+    pdf.cell(200, 10, text=title, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+    pdf.ln(5)
+    _line(pdf, f"Hitch: {HITCH_NAMES[hitch_type]}")
+    _line(pdf, f"Total Load: {result.total_weight:.1f} lbs")
+    force_name = "Tongue Weight" if hitch_type == "bumper" else "Pin Weight"
+    _line(pdf, f"{force_name}: {result.tongue_force_display:.1f} lbs ({result.tongue_pct:.1f}%)")
+    _line(pdf, f"Axle Midpoint: {result.axle_avg:.1f} in")
+    _line(pdf, "Assumptions:")
+    pdf.set_font("Helvetica", size=10)
+    pdf.multi_cell(0, 10, ASSUMPTIONS)
+    pdf.image(io.BytesIO(plot_svg), x=10, w=180)
+
+
+def build_report(result, plot_svg, title=TITLE, hitch_type="bumper"):
+    """Return a single-page PDF report as bytes."""
+    pdf = new_document()
+    add_report_page(pdf, result, plot_svg, title, hitch_type)
+    return bytes(pdf.output())
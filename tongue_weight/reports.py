@@ -0,0 +1,126 @@
+"""Batch PDF reports for a whole dispatch file.
+
+Usage::
+
+    python -m tongue_weight.reports dispatch.jsonl -o reports/ [-j 8] [--single-file fleet.pdf]
+
+Plots and pages are rendered in a process pool.  Each worker warms up
+matplotlib and fpdf2 once in its initializer, and only a bounded window of
+scenarios is in flight at a time, so memory stays flat however long the
+dispatch file is.  The exception is ``--single-file``: fpdf2 keeps every
+page in memory until the document is written (roughly 100 kB per page), so
+split very large dispatch files or use per-scenario PDFs instead.
+
+Scenarios with the same name get the scenario's 1-based index appended to
+their file name (``trip_3.pdf``) rather than overwriting each other.
+"""
+import argparse
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import calculate, with_trailer
+from .plot import render_layout
+from .report import TITLE, add_report_page, build_report, new_document
+from .scenarios import read_scenarios
+
+
+def _init_worker():
+    # Load matplotlib fonts and fpdf2 once per worker rather than per report
+    svg = render_layout(100, [50], [(1, 25)], 0, fmt="svg")
+    build_report(calculate([50], [(1, 25)]), svg)
+
+
+def render_scenario(scenario):
+    """Solve a scenario and render its layout; returns ``(scenario, result, svg)``."""
+    result = calculate(scenario.axle_positions, scenario.loads, scenario.trailer_weight, scenario.trailer_cg,
+                       scenario.hitch_position, scenario.hitch_type)
+    loads = with_trailer(scenario.loads, scenario.trailer_weight, scenario.trailer_cg)
+    svg = render_layout(scenario.trailer_length, scenario.axle_positions, loads,
+                        result.tongue_force_display, fmt="svg", hitch_position=scenario.hitch_position)
+    return scenario, result, svg
+
+
+def safe_filename(name):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._") or "scenario"
+
+
+def unique_filenames(scenarios):
+    """Yield ``(scenario, filename)`` pairs, appending the scenario index to names already used."""
+    used = set()
+    for index, scenario in enumerate(scenarios, 1):
+        stem = name = safe_filename(scenario.name)
+        repeat = 0
+        while name.lower() in used:  # case-insensitive filesystems collide too
+            repeat += 1
+            name = f"{stem}_{index}" if repeat == 1 else f"{stem}_{index}_{repeat}"
+        used.add(name.lower())
+        yield scenario, name + ".pdf"
+
+
+def write_scenario_report(scenario, out_dir, filename=None):
+    """Render one scenario to ``<out_dir>/<filename>`` (default ``<name>.pdf``) and return the path."""
+    scenario, result, svg = render_scenario(scenario)
+    path = os.path.join(out_dir, filename or safe_filename(scenario.name) + ".pdf")
+    with open(path, "wb") as f:
+        f.write(build_report(result, svg, title=f"{TITLE}: {scenario.name}", hitch_type=scenario.hitch_type))
+    return path
+
+
+def _write_named_report(named, out_dir):
+    return write_scenario_report(named[0], out_dir, named[1])
+
+
+def bounded_map(executor, fn, iterable, *args, window=32):
+    """Like ``executor.map`` but never holds more than ``window`` pending tasks."""
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(fn, item, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def generate_reports(scenarios, out_dir, workers=None, single_file=None):
+    """Write one PDF per scenario into ``out_dir``, or one multi-page ``single_file``.
+
+    File names come from :func:`unique_filenames`.  ``single_file`` holds the
+    whole document in memory until it is written.  Returns the number of
+    scenarios processed.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = workers * 4
+    count = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        if single_file:
+            pdf = new_document()
+            for scenario, result, svg in bounded_map(executor, render_scenario, scenarios, window=window):
+                add_report_page(pdf, result, svg, title=f"{TITLE}: {scenario.name}", hitch_type=scenario.hitch_type)
+                count += 1
+            pdf.output(single_file)
+        else:
+            os.makedirs(out_dir, exist_ok=True)
+            for _ in bounded_map(executor, _write_named_report, unique_filenames(scenarios), out_dir,
+                                 window=window):
+                count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate tongue weight PDF reports for a scenario file.")
+    parser.add_argument("scenarios", help="JSON Lines (or .json list) file of scenarios")
+    parser.add_argument("-o", "--out-dir", default="reports", help="directory for per-scenario PDFs")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--single-file",
+                        help="write one multi-page PDF to this path instead (held in memory until written)")
+    args = parser.parse_args(argv)
+
+    count = generate_reports(read_scenarios(args.scenarios), args.out_dir, args.workers, args.single_file)
+    print(f"Wrote {count} report(s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Scenario records for batch tools.
+
+A scenario mirrors the sidebar inputs.  In JSON it looks like::
+
+    {"name": "unit-12", "trailer_length": 214, "axle_positions": [134, 170],
+     "loads": [[11305, 139]], "trailer_weight": 2400, "trailer_cg": 100}
+
+``loads`` may instead be given as parallel ``load_weights``/``load_cgs``
+lists.  ``trailer_weight`` defaults to 0 and ``trailer_cg`` to half the
+trailer length, as in the app.  ``hitch_type`` (``"bumper"``,
+``"gooseneck"`` or ``"fifth_wheel"``) defaults to ``"bumper"`` and
+``hitch_position``, the pin position for the other types, to 0.
+
+CSV files use the same column names, with list columns (``axle_positions``,
+``load_weights``, ``load_cgs``) separated by semicolons::
+
+    name,trailer_length,axle_positions,load_weights,load_cgs,trailer_weight,trailer_cg
+    unit-12,214,134;170,11305,139,2400,100
+
+Every scenario needs at least one axle, and the axles' average position
+must differ from ``hitch_position``; :func:`scenario_from_dict` raises
+``ValueError`` otherwise.
+
+All readers are generators.  The CSV and JSON Lines readers stream
+arbitrarily large files in constant memory; a ``.json`` list has to be
+parsed whole before the first scenario comes out, so use JSON Lines for
+large files.
+"""
+import csv
+import json
+from collections import namedtuple
+
+Scenario = namedtuple(
+    "Scenario",
+    ["name", "trailer_length", "axle_positions", "loads", "trailer_weight", "trailer_cg", "hitch_type",
+     "hitch_position"],
+    defaults=("bumper", 0.0),
+)
+
+
+def scenario_from_dict(record, index=0):
+    """Build a :class:`Scenario` from a decoded JSON object, raising ``ValueError`` if it cannot be solved."""
+    trailer_length = float(record["trailer_length"])
+    if "loads" in record:
+        loads = [(float(w), float(cg)) for w, cg in record["loads"]]
+    else:
+        loads = [(float(w), float(cg)) for w, cg in zip(record["load_weights"], record["load_cgs"])]
+    trailer_cg = record.get("trailer_cg")
+    name = str(record.get("name") or f"scenario_{index + 1:05d}")
+    axle_positions = [float(p) for p in record["axle_positions"]]
+    hitch_position = float(record.get("hitch_position") or 0)
+    if not axle_positions:
+        raise ValueError(f"scenario {name!r}: at least one axle position is required")
+    if sum(axle_positions) / len(axle_positions) == hitch_position:
+        raise ValueError(f"scenario {name!r}: the axles cannot sit at the hitch position")
+    return Scenario(
+        name=name,
+        trailer_length=trailer_length,
+        axle_positions=axle_positions,
+        loads=loads,
+        trailer_weight=float(record.get("trailer_weight") or 0),
+        trailer_cg=trailer_length / 2 if trailer_cg is None else float(trailer_cg),
+        hitch_type=str(record.get("hitch_type") or "bumper"),
+        hitch_position=hitch_position,
+    )
+
+
+def iter_jsonl(fp):
+    """Yield scenarios from a JSON Lines stream one line at a time."""
+    index = 0
+    for line in fp:
+        if line.strip():
+            yield scenario_from_dict(json.loads(line), index)
+            index += 1
+
+
+def iter_json(fp):
+    """Yield scenarios from a JSON document holding a list of objects (the whole document is loaded first)."""
+    for index, record in enumerate(json.load(fp)):
+        yield scenario_from_dict(record, index)
+
+
+def _split_list(value):
+    return [float(v) for v in value.replace(",", ";").split(";") if v.strip()]
+
+
+def iter_csv(fp):
+    """Yield scenarios from a CSV stream with a header row."""
+    for index, row in enumerate(csv.DictReader(fp)):
+        record = {key: value for key, value in row.items() if value not in (None, "")}
+        for key in ("axle_positions", "load_weights", "load_cgs"):
+            record[key] = _split_list(record.get(key, ""))
+        yield scenario_from_dict(record, index)
+
+
+READERS = {"jsonl": iter_jsonl, "json": iter_json, "csv": iter_csv}
+
+
+def guess_format(path):
+    """Reader name for a file path, based on its extension (JSON Lines by default)."""
+    path = str(path).lower()
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith(".json"):
+        return "json"
+    return "jsonl"
+
+
+def read_scenarios(path, fmt=None):
+    """Yield scenarios from a CSV, ``.json`` list or JSON Lines file."""
+    with open(path, encoding="utf-8", newline="") as fp:
+        yield from READERS[fmt or guess_format(path)](fp)
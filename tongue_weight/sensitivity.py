@@ -0,0 +1,92 @@
+"""Exact partial derivatives of tongue force and percentage.
+
+With ``W = sum(w) + tw``, ``M = sum(w * cg) + tw * tcg`` and ``a`` the mean of
+``n`` axle positions, the displayed tongue force with the hitch at ``p`` is
+``T = (W * a - M) / d`` where ``d = a - p``, so
+
+* ``dT/dw_i  = (a - cg_i) / d``        * ``dT/dcg_i = -w_i / d``
+* ``dT/dx_j  = (M - W * p) / (n * d**2)``
+* ``dT/dtw = (a - tcg) / d``, ``dT/dtcg = -tw / d``
+
+and ``P = 100 * T / W`` follows by the quotient rule.  ``raw_tongue_force``
+is ``-T``, so its derivatives are the negated force sensitivities.
+
+Inputs are batched like :mod:`tongue_weight.batch`: (N, K) zero-padded
+loads, (N, A) NaN-padded axles and (N,) trailer values; a single scenario
+may be passed as 1-D arrays.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+Sensitivity = namedtuple("Sensitivity", ["load_weight", "load_cg", "axle_position", "trailer_weight", "trailer_cg"])
+
+
+def sensitivities(load_weights, load_cgs, axle_positions, trailer_weight=0.0, trailer_cg=0.0, hitch_position=0.0):
+    """Return ``(force, pct)`` :class:`Sensitivity` tuples of tongue force (lbs) and tongue %.
+
+    Padded axle entries get NaN sensitivities.  Where the total weight is
+    zero the percentage sensitivities are NaN.
+    """
+    w = np.asarray(load_weights, dtype=float)
+    c = np.asarray(load_cgs, dtype=float)
+    x = np.asarray(axle_positions, dtype=float)
+    tw = np.asarray(trailer_weight, dtype=float)
+    tc = np.asarray(trailer_cg, dtype=float)
+    p = np.asarray(hitch_position, dtype=float)
+
+    valid = ~np.isnan(x)
+    n = valid.sum(axis=-1)
+    a = np.where(valid, x, 0.0).sum(axis=-1) / n
+    W = w.sum(axis=-1) + tw
+    M = np.einsum("...k,...k->...", w, c) + tw * tc
+    d = a - p
+    T = (W * a - M) / d
+
+    a_k, d_k = a[..., None], d[..., None]
+    force = Sensitivity(
+        load_weight=(a_k - c) / d_k,
+        load_cg=-w / d_k,
+        axle_position=np.where(valid, ((M - W * p) / (n * d * d))[..., None], np.nan),
+        trailer_weight=(a - tc) / d,
+        trailer_cg=-tw / d,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_W = np.where(W != 0, 1 / W, np.nan)
+        pct_of_T = 100 * inv_W  # dP/dT with W held fixed
+        weight_term = 100 * T * inv_W * inv_W  # subtracted when W itself changes
+        pct = Sensitivity(
+            load_weight=force.load_weight * pct_of_T[..., None] - weight_term[..., None],
+            load_cg=force.load_cg * pct_of_T[..., None],
+            axle_position=force.axle_position * pct_of_T[..., None],
+            trailer_weight=force.trailer_weight * pct_of_T - weight_term,
+            trailer_cg=force.trailer_cg * pct_of_T,
+        )
+    return force, pct
+
+
+def ranked_effects(pct, load_weights, weight_step_pct=10.0, position_step=6.0, trailer_weight=0.0):
+    """Linearized tongue-% swing for a realistic change of each input of one scenario.
+
+    Weights move by ``weight_step_pct`` percent and positions by
+    ``position_step`` inches.  Returns ``(labels, swings)`` sorted by
+    decreasing absolute swing, where ``swings`` is the change in tongue %
+    when the input increases.
+    """
+    load_weights = np.asarray(load_weights, dtype=float)
+    labels, swings = [], []
+    for i, (dw, dc) in enumerate(zip(pct.load_weight, pct.load_cg)):
+        labels += [f"Load {i+1} weight ±{weight_step_pct:g}%", f"Load {i+1} CG ±{position_step:g} in"]
+        swings += [dw * load_weights[i] * weight_step_pct / 100, dc * position_step]
+    for j, dx in enumerate(pct.axle_position):
+        if not np.isnan(dx):
+            labels.append(f"Axle {j+1} position ±{position_step:g} in")
+            swings.append(dx * position_step)
+    if trailer_weight > 0:
+        labels += [f"Trailer weight ±{weight_step_pct:g}%", f"Trailer CG ±{position_step:g} in"]
+        swings += [float(pct.trailer_weight) * trailer_weight * weight_step_pct / 100,
+                   float(pct.trailer_cg) * position_step]
+    swings = np.asarray(swings, dtype=float)
+    order = np.argsort(-np.abs(swings), kind="stable")
+    return [labels[i] for i in order], swings[order]
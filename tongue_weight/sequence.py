@@ -0,0 +1,113 @@
+"""Loading sequences: tongue weight after every pallet goes on or comes off.
+
+:func:`simulate_sequence` streams the state after each step using running
+weight and moment sums, so each step is O(1).  :func:`find_safe_order`
+searches for an order in which every intermediate state stays inside the
+tongue percentage band.
+
+The search is a depth-first search over which items are already loaded.
+The state after loading a set of items does not depend on the order they
+went on, so a set that is known to be a dead end is never explored again.
+Children are tried closest-to-band-centre first, which usually finds an
+order without backtracking.
+"""
+from collections import namedtuple
+
+from .core import TONGUE_PCT_HIGH, TONGUE_PCT_LOW, axle_average, classify, raw_tongue_force, tongue_pct
+
+SequenceStep = namedtuple("SequenceStep", ["step", "weight", "cg", "total_weight", "tongue_force", "tongue_pct", "status"])
+
+MAX_NODES = 200_000
+# Largest table the app offers to reorder; beyond this a failed search can take seconds
+MAX_ORDER_ITEMS = 100
+
+
+def _state(total_weight, total_moment, axle_avg, hitch_position=0.0):
+    force = -raw_tongue_force(total_weight, total_moment, axle_avg, hitch_position)
+    pct = tongue_pct(force, total_weight)
+    return force, pct
+
+
+def simulate_sequence(steps, axle_positions, base_weight=0.0, base_moment=0.0,
+                      low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, hitch_position=0.0):
+    """Yield a :class:`SequenceStep` after each ``(weight, cg)`` step.
+
+    A negative weight removes a load from that CG.  ``base_weight`` and
+    ``base_moment`` describe what is already on the trailer (e.g. the
+    trailer structure).
+    """
+    axle_avg = axle_average(axle_positions)
+    total_weight, total_moment = float(base_weight), float(base_moment)
+    for i, (weight, cg) in enumerate(steps, start=1):
+        total_weight += weight
+        total_moment += weight * cg
+        force, pct = _state(total_weight, total_moment, axle_avg, hitch_position)
+        yield SequenceStep(i, weight, cg, total_weight, force, pct, classify(pct, total_weight, low, high))
+
+
+def find_safe_order(weights, cgs, axle_positions, base_weight=0.0, base_moment=0.0,
+                    low=TONGUE_PCT_LOW, high=TONGUE_PCT_HIGH, check_from=1, max_nodes=MAX_NODES,
+                    hitch_position=0.0):
+    """Order (list of item indices) that keeps every step from ``check_from`` on within the band.
+
+    Returns ``None`` when no such order exists or the search gives up after
+    ``max_nodes`` expanded states.
+    """
+    weights = [float(w) for w in weights]
+    cgs = [float(c) for c in cgs]
+    n = len(weights)
+    axle_avg = axle_average(axle_positions)
+    centre = 0.5 * (low + high)
+
+    def ok(depth, total_weight, total_moment):
+        if depth < check_from:
+            return True
+        _, pct = _state(total_weight, total_moment, axle_avg, hitch_position)
+        return total_weight != 0 and low <= pct <= high
+
+    # The fully loaded state is reached by every order, so check it first
+    full_weight = base_weight + sum(weights)
+    full_moment = base_moment + sum(w * c for w, c in zip(weights, cgs))
+    if n and not ok(n, full_weight, full_moment):
+        return None
+
+    dead = set()
+    order = []
+    nodes = 0
+    # Iterative DFS: each frame is (loaded mask, weight, moment, remaining candidate list)
+    stack = []
+
+    def candidates(mask, total_weight, total_moment):
+        depth = len(order) + 1
+        options = []
+        for i in range(n):
+            if mask >> i & 1:
+                continue
+            w = total_weight + weights[i]
+            m = total_moment + weights[i] * cgs[i]
+            child = mask | 1 << i
+            if child in dead or not ok(depth, w, m):
+                continue
+            _, pct = _state(w, m, axle_avg, hitch_position)
+            options.append((abs(pct - centre), i, child, w, m))
+        options.sort(reverse=True)  # pop() takes the best option first
+        return options
+
+    stack.append((0, float(base_weight), float(base_moment), candidates(0, base_weight, base_moment)))
+    while stack:
+        mask, total_weight, total_moment, options = stack[-1]
+        if len(order) == n:
+            return order
+        if not options:
+            dead.add(mask)
+            stack.pop()
+            if order:
+                order.pop()
+            continue
+        nodes += 1
+        if nodes > max_nodes:
+            return None
+        _, i, child, w, m = options.pop()
+        order.append(i)
+        stack.append((child, w, m, candidates(child, w, m)))
+    return None
@@ -0,0 +1,194 @@
+"""Trailer sway critical speed from a linear car-trailer yaw model.
+
+The tow vehicle is a bicycle model with front and rear axles, the trailer
+is a rigid body hinged at the hitch and running on its virtual axle.  In
+the generalized coordinates ``q = [y1, psi1, psi2]`` (tow vehicle lateral
+position and both yaw angles) every tire point has lateral position
+``J @ q`` and heading ``h @ q``, and a linear tire produces
+``F = C * (h @ q - J @ q' / u)`` at forward speed ``u``, so::
+
+    Mass @ q'' + (sum C J J^T / u) @ q' - (sum C J h^T) @ q = 0
+
+Rewriting the state as ``[v, r1, r2, theta]`` (tow vehicle lateral velocity,
+both yaw rates and the articulation angle) drops the two neutral modes
+(sideways drift and heading), and the combination sways once the 4 x 4
+system matrix gets an eigenvalue with positive real part.
+
+Inputs come straight from the static solution: the trailer CG follows from
+``tongue_force``, ``total_weight`` and ``axle_avg``, axle loads set each
+cornering stiffness (``coefficient * axle load``), and the trailer yaw
+inertia is estimated from the load distribution by
+:func:`trailer_yaw_inertia`.  Loads are point masses there, so the
+estimate never drops below the inertia of the same weight spread evenly
+along the deck; otherwise a single load with no structure weight would have
+no yaw inertia at all and look perfectly stable.  The tow vehicle CG comes
+from its curb axle weights and its yaw inertia from the usual ``m * a * b``
+estimate.
+
+Everything is batched: parameters broadcast to ``(N,)`` and the eigenvalue
+problems are solved as stacked ``(N, 4, 4)`` arrays, with a coarse speed
+scan followed by a vectorized bisection.  Units are lbs, inches and
+seconds; speeds are reported in mph.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .towvehicle import tow_vehicle_loads
+
+GRAVITY = 386.09  # in/s^2
+MPH = 17.6  # in/s per mph
+
+# Lateral force per unit axle load per radian of slip
+CAR_CORNERING_COEF = 10.0
+TRAILER_CORNERING_COEF = 6.0
+
+SCAN_SPEEDS_MPH = np.linspace(5.0, 150.0, 30)
+BISECTION_STEPS = 30
+
+# Below this radius of gyration of the whole trailer (in) the inertia is too uncertain to report a speed
+MIN_GYRATION = 1.0
+
+SwayResult = namedtuple("SwayResult", ["critical_speed", "damping_ratio", "frequency"])
+
+
+def trailer_yaw_inertia(weights, cgs, offsets=None, trailer_weight=0.0, trailer_cg=0.0, trailer_length=0.0):
+    """Yaw moment of inertia about the combined CG, in lbs·in² (divide by g for mass units).
+
+    Loads are point masses at ``(cg, offset)``; the trailer structure is a
+    uniform beam of ``trailer_length`` centred on ``trailer_cg``.  The result
+    is at least ``total_weight * trailer_length**2 / 12``, the whole weight
+    spread along the deck.  Accepts zero-padded ``(N, K)`` load arrays like
+    :mod:`tongue_weight.batch`.
+    """
+    w = np.asarray(weights, dtype=float)
+    x = np.asarray(cgs, dtype=float)
+    y = np.zeros_like(x) if offsets is None else np.asarray(offsets, dtype=float)
+    tw = np.asarray(trailer_weight, dtype=float)
+    tc = np.asarray(trailer_cg, dtype=float)
+    total = w.sum(axis=-1) + tw
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cg = (np.einsum("...k,...k->...", w, x) + tw * tc) / total
+        y_cg = np.einsum("...k,...k->...", w, y) / total
+    dx = x - x_cg[..., None]
+    dy = y - y_cg[..., None]
+    loads = np.einsum("...k,...k->...", w, dx * dx + dy * dy)
+    length_sq = np.asarray(trailer_length, dtype=float) ** 2
+    structure = tw * (length_sq / 12 + (tc - x_cg) ** 2 + y_cg ** 2)
+    return np.maximum(loads + structure, total * length_sq / 12)
+
+
+def _system_matrix(speed, total_weight, tongue_force, axle_avg, yaw_inertia, wheelbase, hitch_overhang,
+                   curb_front, curb_rear, hitch_position, car_cornering, trailer_cornering):
+    # Reduced (..., 4, 4) state matrix for [v, r1, r2, theta] at forward speed ``speed`` (in/s)
+    shape = np.broadcast_shapes(*(np.shape(v) for v in (speed, total_weight, tongue_force, axle_avg, yaw_inertia,
+                                                        wheelbase, hitch_overhang, curb_front, curb_rear,
+                                                        hitch_position)))
+    b = lambda v: np.broadcast_to(np.asarray(v, dtype=float), shape)  # noqa: E731
+    u, W, T, I2 = b(speed), b(total_weight), b(tongue_force), b(yaw_inertia) / GRAVITY
+    L1, overhang, p = b(wheelbase), b(hitch_overhang), b(hitch_position)
+
+    # Tow vehicle geometry: CG a1 behind the front axle, hitch c1 behind the CG
+    car_weight = b(curb_front) + b(curb_rear)
+    a1 = L1 * b(curb_rear) / car_weight
+    b1 = L1 - a1
+    c1 = b1 + overhang
+    m1, I1 = car_weight / GRAVITY, car_weight / GRAVITY * a1 * b1
+
+    # Trailer geometry measured back from the hitch: CG at d2, axle at span
+    span = b(axle_avg) - p
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d2 = span * (1 - T / W)
+    m2 = W / GRAVITY
+
+    front, rear, _ = tow_vehicle_loads(T, L1, overhang, b(curb_front), b(curb_rear))
+    zero, one = np.zeros(shape), np.ones(shape)
+    tires = (
+        (car_cornering * front, np.stack([one, a1, zero], -1), 1),
+        (car_cornering * rear, np.stack([one, -b1, zero], -1), 1),
+        (trailer_cornering * (W - T), np.stack([one, -c1, -span], -1), 2),
+    )
+
+    J2 = np.stack([one, -c1, -d2], -1)
+    mass = m2[..., None, None] * J2[..., :, None] * J2[..., None, :]
+    mass[..., 0, 0] += m1
+    mass[..., 1, 1] += I1
+    mass[..., 2, 2] += I2
+    damping = np.zeros(shape + (3, 3))
+    stiffness = np.zeros(shape + (3, 3))
+    for C, J, heading in tires:
+        damping += (C / u)[..., None, None] * J[..., :, None] * J[..., None, :]
+        stiffness[..., :, heading] -= C[..., None] * J
+
+    # First-order form in z = [q, q'], then change to w = [v, r1, r2, theta, psi1, y1]
+    inv_mass = np.linalg.inv(mass)
+    A = np.zeros(shape + (6, 6))
+    A[..., :3, 3:] = np.eye(3)
+    A[..., 3:, :3] = -inv_mass @ stiffness
+    A[..., 3:, 3:] = -inv_mass @ damping
+    P = np.zeros(shape + (6, 6))
+    P[..., 0, 3], P[..., 0, 1] = 1.0, -u
+    P[..., 1, 4] = P[..., 2, 5] = 1.0
+    P[..., 3, 1], P[..., 3, 2] = 1.0, -1.0
+    P[..., 4, 1] = P[..., 5, 0] = 1.0
+    return (P @ A @ np.linalg.inv(P))[..., :4, :4]
+
+
+def sway_eigenvalues(speed_mph, total_weight, tongue_force, axle_avg, yaw_inertia, wheelbase, hitch_overhang,
+                     curb_front, curb_rear, hitch_position=0.0, car_cornering=CAR_CORNERING_COEF,
+                     trailer_cornering=TRAILER_CORNERING_COEF):
+    """Eigenvalues (1/s) of the reduced car-trailer system, shaped ``(..., 4)``."""
+    return np.linalg.eigvals(_system_matrix(np.asarray(speed_mph, dtype=float) * MPH, total_weight, tongue_force,
+                                            axle_avg, yaw_inertia, wheelbase, hitch_overhang, curb_front,
+                                            curb_rear, hitch_position, car_cornering, trailer_cornering))
+
+
+def _growth(speed_mph, args):
+    return sway_eigenvalues(speed_mph, *args).real.max(axis=-1)
+
+
+def sway_stability(total_weight, tongue_force, axle_avg, yaw_inertia, wheelbase, hitch_overhang, curb_front,
+                   curb_rear, hitch_position=0.0, car_cornering=CAR_CORNERING_COEF,
+                   trailer_cornering=TRAILER_CORNERING_COEF, check_speed=55.0, scan_speeds=SCAN_SPEEDS_MPH):
+    """Critical sway speed (mph) and the sway mode at ``check_speed``; returns :class:`SwayResult`.
+
+    ``critical_speed`` is ``inf`` when the combination is stable over the
+    whole scan and 0 when it is unstable even at the lowest scan speed.
+    ``damping_ratio`` and ``frequency`` (Hz) describe the least damped
+    oscillatory mode at ``check_speed`` (NaN if no mode oscillates).
+    Scenarios without weight, or with a yaw inertia below
+    ``total_weight * MIN_GYRATION**2``, get NaN throughout.
+    """
+    # Solve a placeholder for unusable rows so one bad row cannot break the batch
+    total_weight = np.asarray(total_weight, dtype=float)
+    loaded = (total_weight > 0) & (np.asarray(yaw_inertia, dtype=float) >= total_weight * MIN_GYRATION ** 2)
+    total_weight = np.where(loaded, total_weight, 1.0)
+    tongue_force = np.where(loaded, tongue_force, 0.0)
+    yaw_inertia = np.where(loaded, yaw_inertia, 1.0)
+    args = (total_weight, tongue_force, axle_avg, yaw_inertia, wheelbase, hitch_overhang, curb_front, curb_rear,
+            hitch_position, car_cornering, trailer_cornering)
+    shape = np.broadcast_shapes(*(np.shape(v) for v in args[:9]))
+    scan_speeds = np.asarray(scan_speeds, dtype=float)
+
+    # Coarse scan for the first unstable speed, then bisect inside that bracket
+    unstable = np.stack([_growth(np.full(shape, s), args) > 0 for s in scan_speeds], axis=-1)
+    first = np.where(unstable.any(axis=-1), unstable.argmax(axis=-1), len(scan_speeds))
+    lo = scan_speeds[np.clip(first - 1, 0, len(scan_speeds) - 1)]
+    hi = scan_speeds[np.clip(first, 0, len(scan_speeds) - 1)]
+    for _ in range(BISECTION_STEPS):
+        mid = 0.5 * (lo + hi)
+        bad = _growth(mid, args) > 0
+        hi = np.where(bad, mid, hi)
+        lo = np.where(bad, lo, mid)
+    critical = np.where(first == len(scan_speeds), np.inf, np.where(first == 0, 0.0, hi))
+
+    eig = sway_eigenvalues(np.full(shape, float(check_speed)), *args)
+    oscillating = np.abs(eig.imag) > 1e-9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeta = np.where(oscillating, -eig.real / np.abs(eig), np.inf)
+    mode = zeta.argmin(axis=-1)[..., None]
+    damping = np.take_along_axis(zeta, mode, axis=-1)[..., 0]
+    frequency = np.abs(np.take_along_axis(eig, mode, axis=-1)[..., 0].imag) / (2 * np.pi)
+    has_mode = oscillating.any(axis=-1) & loaded
+    return SwayResult(np.where(loaded, critical, np.nan), np.where(has_mode, damping, np.nan),
+                      np.where(has_mode, frequency, np.nan))
@@ -0,0 +1,153 @@
+"""Two-parameter sweeps of tongue percentage.
+
+Any two scenario inputs can be varied over a grid.  Inputs are named
+``"load_weight:<i>"``, ``"load_cg:<i>"``, ``"axle:<j>"`` (0-based),
+``"trailer_weight"`` or ``"trailer_cg"``.
+
+Grid values sit on a fixed lattice, ``value = index * step``, and the grid
+is evaluated in square tiles of lattice indices.  Every tile is a small
+broadcasted NumPy computation, so a 2000 x 2000 sweep never allocates more
+than one tile of temporaries.  The assembled grid itself is capped at
+``MAX_CELLS`` values (16 MB of float32).  Tiles are cached per scenario and step, so
+panning the sweep only computes tiles that were not seen before.
+"""
+import hashlib
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import LRUCache
+
+TILE_SIZE = 256
+MAX_CELLS = 2000 * 2000
+
+# float32 tiles of 256 x 256 are 256 kB, so 256 entries stay within ~64 MB
+tile_cache = LRUCache(max_entries=256)
+
+SweepResult = namedtuple("SweepResult", ["xs", "ys", "tongue_pct"])
+
+
+def parameter_names(num_loads, num_axles, trailer=True):
+    """All sweepable parameter names for a scenario of the given size."""
+    names = []
+    for i in range(num_loads):
+        names += [f"load_weight:{i}", f"load_cg:{i}"]
+    names += [f"axle:{j}" for j in range(num_axles)]
+    if trailer:
+        names += ["trailer_weight", "trailer_cg"]
+    return names
+
+
+def parameter_label(name):
+    """Human-readable label for a parameter name, e.g. ``"Load 1 CG (in)"``."""
+    kind, _, index = name.partition(":")
+    number = int(index) + 1 if index else None
+    return {
+        "load_weight": f"Load {number} Weight (lbs)",
+        "load_cg": f"Load {number} CG (in)",
+        "axle": f"Axle {number} Position (in)",
+        "trailer_weight": "Trailer Weight (lbs)",
+        "trailer_cg": "Trailer CG (in)",
+    }[kind]
+
+
+class Sweep:
+    """Sweep engine for one base scenario (the trailer is treated as one more load)."""
+
+    def __init__(self, weights, cgs, axle_positions, trailer_weight=0.0, trailer_cg=0.0,
+                 tile_size=TILE_SIZE, cache=tile_cache, hitch_position=0.0):
+        self.weights = np.append(np.asarray(weights, dtype=float), float(trailer_weight))
+        self.cgs = np.append(np.asarray(cgs, dtype=float), float(trailer_cg))
+        self.axles = np.asarray(axle_positions, dtype=float)
+        self.hitch_position = float(hitch_position)
+        self.tile_size = tile_size
+        self.cache = cache
+        digest = hashlib.sha1()
+        for arr in (self.weights, self.cgs, self.axles, np.float64(self.hitch_position)):
+            digest.update(arr.tobytes())
+        self.key = digest.hexdigest()
+
+    def _target(self, name):
+        # Map a parameter name to ("load", index) or ("axle", index); the trailer is the last load
+        kind, _, index = name.partition(":")
+        if kind in ("trailer_weight", "trailer_cg"):
+            return ("weight" if kind == "trailer_weight" else "cg"), len(self.weights) - 1
+        if kind == "axle":
+            return "axle", int(index)
+        return ("weight" if kind == "load_weight" else "cg"), int(index)
+
+    def evaluate(self, px, xs, py, ys):
+        """Tongue % on the full ``len(ys) x len(xs)`` grid (NaN where total weight is 0)."""
+        if px == py:
+            raise ValueError("sweep parameters must differ")
+        grids = {px: np.asarray(xs, dtype=float)[None, :], py: np.asarray(ys, dtype=float)[:, None]}
+
+        weights, cgs, axles = dict(), dict(), dict()
+        for name, grid in grids.items():
+            kind, index = self._target(name)
+            {"weight": weights, "cg": cgs, "axle": axles}[kind][index] = grid
+
+        total_weight = self.weights.sum()
+        total_moment = self.weights @ self.cgs
+        for i in set(weights) | set(cgs):
+            w = weights.get(i, self.weights[i])
+            c = cgs.get(i, self.cgs[i])
+            total_weight = total_weight - self.weights[i] + w
+            total_moment = total_moment - self.weights[i] * self.cgs[i] + w * c
+        axle_sum = self.axles.sum()
+        for j, x in axles.items():
+            axle_sum = axle_sum - self.axles[j] + x
+        axle_avg = axle_sum / len(self.axles)
+
+        total_weight, total_moment, axle_avg = np.broadcast_arrays(total_weight, total_moment, axle_avg)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = 100 * (total_weight * axle_avg - total_moment) / ((axle_avg - self.hitch_position) * total_weight)
+        return np.where(total_weight != 0, pct, np.nan).astype(np.float32)
+
+    def tile(self, px, step_x, tx, py, step_y, ty):
+        """Tongue % for lattice tile ``(tx, ty)``, computed once and cached."""
+        key = (self.key, px, step_x, tx, py, step_y, ty, self.tile_size)
+        size = self.tile_size
+
+        def compute():
+            xs = (tx * size + np.arange(size)) * step_x
+            ys = (ty * size + np.arange(size)) * step_y
+            return self.evaluate(px, xs, py, ys)
+
+        return self.cache.get_or_compute(key, compute)
+
+    @staticmethod
+    def lattice(value_range, step):
+        """First and last lattice index covering ``value_range`` (inclusive)."""
+        return math.floor(value_range[0] / step), math.ceil(value_range[1] / step)
+
+    @classmethod
+    def grid_shape(cls, x_range, step_x, y_range, step_y):
+        """``(rows, columns)`` of the grid :meth:`grid` would assemble."""
+        (i0, i1), (j0, j1) = cls.lattice(x_range, step_x), cls.lattice(y_range, step_y)
+        return j1 - j0 + 1, i1 - i0 + 1
+
+    def grid(self, px, x_range, step_x, py, y_range, step_y):
+        """Assemble the sweep over ``x_range``/``y_range`` (inclusive) from cached tiles.
+
+        Raises ``ValueError`` if the grid would exceed ``MAX_CELLS`` values.
+        """
+        rows, columns = self.grid_shape(x_range, step_x, y_range, step_y)
+        if rows * columns > MAX_CELLS:
+            raise ValueError(f"sweep grid of {columns} x {rows} exceeds {MAX_CELLS} cells; use larger steps")
+        size = self.tile_size
+        i0, i1 = self.lattice(x_range, step_x)
+        j0, j1 = self.lattice(y_range, step_y)
+        out = np.empty((j1 - j0 + 1, i1 - i0 + 1), dtype=np.float32)
+        for ty in range(j0 // size, j1 // size + 1):
+            for tx in range(i0 // size, i1 // size + 1):
+                block = self.tile(px, step_x, tx, py, step_y, ty)
+                # Overlap of this tile with the requested index window
+                a0, a1 = max(i0, tx * size), min(i1 + 1, (tx + 1) * size)
+                b0, b1 = max(j0, ty * size), min(j1 + 1, (ty + 1) * size)
+                out[b0 - j0:b1 - j0, a0 - i0:a1 - i0] = block[b0 - ty * size:b1 - ty * size,
+                                                              a0 - tx * size:a1 - tx * size]
+        xs = np.arange(i0, i1 + 1) * step_x
+        ys = np.arange(j0, j1 + 1) * step_y
+        return SweepResult(xs, ys, out)
@@ -0,0 +1,46 @@
+"""Tow vehicle axle loads from tongue weight.
+
+The tongue force ``T`` acts at the hitch ball, ``hitch_overhang`` behind
+the tow vehicle's rear axle.  Taking moments about the rear axle, the ball
+load levers weight off the steer axle and onto the rear axle::
+
+    front = curb_front - T * overhang / wheelbase
+    rear  = curb_rear  + T * (wheelbase + overhang) / wheelbase
+
+Everything broadcasts, so :func:`pairing_matrix` evaluates every truck
+against every trailer in one pass.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+TowVehicleLoads = namedtuple("TowVehicleLoads", ["front_axle", "rear_axle", "front_unload_pct"])
+
+
+def tow_vehicle_loads(tongue_force, wheelbase, hitch_overhang, curb_front, curb_rear):
+    """Front and rear axle loads and the percentage of curb front load lifted off."""
+    tongue_force = np.asarray(tongue_force, dtype=float)
+    wheelbase = np.asarray(wheelbase, dtype=float)
+    hitch_overhang = np.asarray(hitch_overhang, dtype=float)
+    front_transfer = tongue_force * hitch_overhang / wheelbase
+    front = curb_front - front_transfer
+    rear = curb_rear + tongue_force + front_transfer
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unload_pct = 100 * front_transfer / np.asarray(curb_front, dtype=float)
+    return TowVehicleLoads(front, rear, unload_pct)
+
+
+def pairing_matrix(tongue_forces, wheelbase, hitch_overhang, curb_front, curb_rear):
+    """Loads for every (truck, trailer) pair as ``(trucks, trailers)`` arrays.
+
+    Truck parameters are 1-D arrays of length ``trucks``; ``tongue_forces``
+    has one entry per trailer.
+    """
+    truck = lambda values: np.asarray(values, dtype=float)[:, None]  # noqa: E731
+    return tow_vehicle_loads(np.asarray(tongue_forces, dtype=float)[None, :], truck(wheelbase),
+                             truck(hitch_overhang), truck(curb_front), truck(curb_rear))
+
+
+def within_ratings(loads, front_rating, rear_rating):
+    """Boolean array: both axles at or below their gross axle weight ratings."""
+    return (loads.front_axle <= np.asarray(front_rating)) & (loads.rear_axle <= np.asarray(rear_rating))
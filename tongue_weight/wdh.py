@@ -0,0 +1,60 @@
+"""Weight-distribution hitch (WDH) model.
+
+Tensioned spring bars apply a couple ``C = 2 * bar_tension * bar_length``
+at the hitch head (two bars, each pulled down by its chain ``bar_length``
+behind the ball).  The couple lifts the ball, so part of the tongue load
+moves to the trailer axles and part to the tow vehicle's steer axle:
+
+* ball load ``T' = T - C / axle_avg`` (trailer axles gain ``C / axle_avg``)
+* ``front = curb_front - T' * h / L + C / L``
+* ``rear  = curb_rear + T' * (L + h) / L - C / L``
+
+with ``L`` the wheelbase and ``h`` the rear-axle-to-ball overhang.  Front
+axle load restoration (FALR) is the share of the front-axle load lost to
+the bare tongue load that the bars give back, which is linear in ``C`` and
+so inverts in closed form.  All functions broadcast over scenarios.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .towvehicle import tow_vehicle_loads
+
+DEFAULT_BAR_LENGTH = 30.0
+
+WDHLoads = namedtuple("WDHLoads", ["ball_force", "trailer_axle_gain", "front_axle", "rear_axle", "restoration_pct"])
+
+
+def bar_couple(bar_tension, bar_length=DEFAULT_BAR_LENGTH):
+    """Couple (lb-in) from two spring bars with chain tension ``bar_tension`` each."""
+    return 2 * np.asarray(bar_tension, dtype=float) * np.asarray(bar_length, dtype=float)
+
+
+def wdh_loads(tongue_force, axle_avg, bar_tension, wheelbase, hitch_overhang, curb_front, curb_rear,
+              bar_length=DEFAULT_BAR_LENGTH):
+    """Ball, trailer axle and tow vehicle axle loads with the bars tensioned."""
+    tongue_force = np.asarray(tongue_force, dtype=float)
+    couple = bar_couple(bar_tension, bar_length)
+    trailer_gain = couple / np.asarray(axle_avg, dtype=float)
+    ball = tongue_force - trailer_gain
+    hitched = tow_vehicle_loads(ball, wheelbase, hitch_overhang, curb_front, curb_rear)
+    front = hitched.front_axle + couple / wheelbase
+    rear = hitched.rear_axle - couple / wheelbase
+    bare = tow_vehicle_loads(tongue_force, wheelbase, hitch_overhang, curb_front, curb_rear)
+    lost = curb_front - bare.front_axle
+    with np.errstate(divide="ignore", invalid="ignore"):
+        restoration = np.where(lost != 0, 100 * (front - bare.front_axle) / lost, np.nan)
+    return WDHLoads(ball, trailer_gain, front, rear, restoration)
+
+
+def tension_for_restoration(target_pct, tongue_force, axle_avg, wheelbase, hitch_overhang,
+                            bar_length=DEFAULT_BAR_LENGTH):
+    """Chain tension per bar that restores ``target_pct`` of the lost front-axle load.
+
+    Front-axle gain is ``C * (1 + h / axle_avg) / L`` and the load lost to the
+    bare tongue is ``T * h / L``, so ``C = target * T * h / (1 + h / axle_avg)``.
+    """
+    hitch_overhang = np.asarray(hitch_overhang, dtype=float)
+    couple = (np.asarray(target_pct, dtype=float) / 100 * np.asarray(tongue_force, dtype=float)
+              * hitch_overhang / (1 + hitch_overhang / np.asarray(axle_avg, dtype=float)))
+    return couple / (2 * np.asarray(bar_length, dtype=float))
@@ -1,9 +1,34 @@
-import streamlit as st
-import matplotlib.pyplot as plt
+import copy
+
 import numpy as np
-from fpdf import FPDF
-import tempfile
-import os
+import pandas as pd
+import streamlit as st
+
+from tongue_weight import hitch_band, raw_tongue_force, solve_totals
+from tongue_weight.axles import axle_reactions, axle_utilization, effective_axle_position
+from tongue_weight.consumables import drain_curve, fill_curve, tank_totals
+from tongue_weight.distributed import distributed_totals, equivalent_point_loads, trapezoid_from_weight
+from tongue_weight.dynamic import (DEFAULT_MAX_ACCEL_G, DEFAULT_MAX_BRAKING_G, DEFAULT_MAX_GRADE_PCT,
+                                   tongue_envelope)
+from tongue_weight.incremental import RunningTotals, editor_changes
+from tongue_weight.inverse import fit_trailer, solve_load_cg, solve_trailer
+from tongue_weight.lateral import DEFAULT_TRACK_WIDTH, wheel_loads
+from tongue_weight.loads import LoadTable
+from tongue_weight.montecarlo import simulate
+from tongue_weight.optimize import rebalance_loads, single_load_shifts
+from tongue_weight.planner import MAX_EXACT_ITEMS, plan_cargo
+from tongue_weight.plot import (cached_heatmap, cached_layout, cached_plan_view, cached_tornado, draw_heatmap,
+                                layout_cache, render_figure)
+from tongue_weight.report import build_report
+from tongue_weight.sensitivity import ranked_effects, sensitivities
+from tongue_weight.sequence import MAX_ORDER_ITEMS, find_safe_order, simulate_sequence
+from tongue_weight.sway import SCAN_SPEEDS_MPH, sway_stability, trailer_yaw_inertia
+from tongue_weight.sweep import MAX_CELLS, Sweep, parameter_label, parameter_names
+from tongue_weight.towvehicle import tow_vehicle_loads
+from tongue_weight.wdh import DEFAULT_BAR_LENGTH, tension_for_restoration, wdh_loads
+
+SUSPENSION_LABELS = {"Equalized leaf springs": "equalized", "Independent torsion": "independent"}
+HITCH_LABELS = {"Bumper pull": "bumper", "Gooseneck": "gooseneck", "Fifth wheel": "fifth_wheel"}
 
 # Page Setup
 st.set_page_config(layout="wide", page_title="Trailer Tongue Weight Calculator")
@@ -18,102 +43,613 @@ st.sidebar.header("🔧 Input Parameters")
 
 trailer_length = st.sidebar.number_input("Trailer Length (in)", value=214)
 
+hitch_label = st.sidebar.selectbox("Hitch Type", list(HITCH_LABELS))
+hitch_type = HITCH_LABELS[hitch_label]
+hitch_position = 0.0
+if hitch_type != "bumper":
+    hitch_position = st.sidebar.number_input("King Pin / Coupler Position (in)", value=30.0)
+    st.sidebar.caption("Measure the pin, axles and load CGs from the front of the trailer.")
+band_low, band_high = hitch_band(hitch_type)
+band_centre = 0.5 * (band_low + band_high)
+force_name = "Tongue Weight" if hitch_type == "bumper" else "Pin Weight"
+datum = "Hitch" if hitch_type == "bumper" else "Trailer Front"  # what sidebar positions are measured from
+
 num_axles = st.sidebar.selectbox("Number of Axles", [1, 2, 3], index=1)
-axle_positions = [st.sidebar.number_input(f"Axle {i+1} Position from Hitch (in)", value=134 + i*36) for i in range(num_axles)]
-axle_avg = sum(axle_positions) / len(axle_positions)
+# Keyed so the entries survive the label change when switching hitch types
+axle_positions = [st.sidebar.number_input(f"Axle {i+1} Position from {datum} (in)", value=134 + i*36, key=f"axle_{i}")
+                  for i in range(num_axles)]
+axle_rating = st.sidebar.number_input("Axle Rating (lbs, each)", min_value=1, value=7000)
+track_width = st.sidebar.number_input("Track Width (in)", min_value=1.0, value=DEFAULT_TRACK_WIDTH,
+                                      help="Centre-to-centre distance between the left and right wheels")
+suspension_label = st.sidebar.selectbox("Suspension", list(SUSPENSION_LABELS))
+suspension = SUSPENSION_LABELS[suspension_label]
+axle_stiffness = None
+if suspension == "independent" and num_axles > 1:
+    axle_stiffness = [st.sidebar.number_input(f"Axle {i+1} Stiffness (lbs/in)", min_value=1, value=1000)
+                      for i in range(num_axles)]
 
-num_loads = st.sidebar.number_input("Number of Loads", min_value=1, max_value=5, value=1)
-loads = []
-for i in range(num_loads):
-    weight = st.sidebar.number_input(f"Load {i+1} Weight (lbs)", value=11305 if i == 0 else 0)
-    cg = st.sidebar.number_input(f"Load {i+1} CG from Hitch (in)", value=139 if i == 0 else 100)
-    loads.append((weight, cg))
+st.sidebar.subheader("📦 Loads")
+# The CG header stays fixed (the caption names the datum): renaming a column would reset the editor's rows
+load_cg_column = "CG (in)"
+default_loads = pd.DataFrame({"Weight (lbs)": [11305.0], load_cg_column: [139.0], "Lateral (in)": [0.0],
+                              "Height (in)": [40.0]})
+load_df = st.sidebar.data_editor(
+    default_loads,
+    num_rows="dynamic",
+    hide_index=True,
+    key="load_table",
+)
+st.sidebar.caption(f"CG: distance from the {datum.lower()}. Lateral: offset from the trailer centreline, "
+                   "+ = right (curb) side. Height: CG height above the ground.")
+load_table = LoadTable.from_columns(load_df["Weight (lbs)"], load_df[load_cg_column], load_df["Lateral (in)"],
+                                    load_df["Height (in)"])
+
+st.sidebar.subheader("📏 Distributed Loads")
+dist_df = st.sidebar.data_editor(
+    pd.DataFrame({"Start (in)": [], "End (in)": [], "Weight (lbs)": [], "End/Start Intensity": []}, dtype=float),
+    num_rows="dynamic",
+    hide_index=True,
+    column_config={"End/Start Intensity": st.column_config.NumberColumn(min_value=0.0)},
+    key="distributed_table",
+)
+st.sidebar.caption("Pipe, lumber or bulk cargo spread along the deck. "
+                   "End/Start Intensity: 1 = uniform, 0 = tapering to nothing at the end.")
+dist_df = dist_df.dropna(subset=["Start (in)", "End (in)", "Weight (lbs)"])
+# A negative intensity ratio would flip the load's sign part way along (and -1 divides by zero)
+dist_df = dist_df[(dist_df["End (in)"] > dist_df["Start (in)"]) & ~(dist_df["End/Start Intensity"] < 0)]
+dist_starts = dist_df["Start (in)"].to_numpy(float)
+dist_ends = dist_df["End (in)"].to_numpy(float)
+dist_q_starts, dist_q_ends = trapezoid_from_weight(dist_starts, dist_ends, dist_df["Weight (lbs)"].to_numpy(float),
+                                                   dist_df["End/Start Intensity"].fillna(1.0).to_numpy(float))
+distributed = list(zip(dist_starts.tolist(), dist_ends.tolist(), dist_q_starts.tolist(), dist_q_ends.tolist()))
+dist_weights, dist_cgs = equivalent_point_loads(dist_starts, dist_ends, dist_q_starts, dist_q_ends)
+
+st.sidebar.subheader("🛢️ Tanks")
+tank_df = st.sidebar.data_editor(
+    pd.DataFrame({"Capacity (gal)": [], "Density (lb/gal)": [], "CG (in)": [], "Fill (%)": [], "Use (gal/h)": []},
+                 dtype=float),
+    num_rows="dynamic",
+    hide_index=True,
+    key="tank_table",
+).dropna(subset=["Capacity (gal)", "CG (in)"])
+st.sidebar.caption("Water, fuel or spray mix. Density: water 8.34, diesel 7.1. "
+                   "Use: drain rate for the trip curve (negative fills).")
+tank_density = tank_df["Density (lb/gal)"].fillna(8.34).to_numpy(float)
+tank_capacities = tank_df["Capacity (gal)"].to_numpy(float) * tank_density
+tank_cgs = tank_df["CG (in)"].to_numpy(float)
+tank_fills = tank_df["Fill (%)"].fillna(100.0).to_numpy(float) / 100
+tank_rates = tank_df["Use (gal/h)"].fillna(0.0).to_numpy(float) * tank_density
+tank_contents = tank_capacities * np.clip(tank_fills, 0.0, 1.0)
 
 # Optional Trailer Weight
 st.sidebar.markdown("---")
 st.sidebar.subheader("⚖️ Optional: Trailer Structure Weight")
 trailer_weight = st.sidebar.number_input("Trailer Weight (lbs)", value=0)
-trailer_cg = st.sidebar.number_input("Trailer CG from Hitch (in)", value=trailer_length / 2)
+trailer_cg = st.sidebar.number_input(f"Trailer CG from {datum} (in)", value=trailer_length / 2)
 
-# Add trailer weight if given
+# Calculations (load totals are kept in session state and updated only for the rows the editor reports as edited;
+# rows follow the editor, so blank weights count as zero instead of being dropped)
+editor_state = st.session_state["load_table"]
+changed_rows = editor_changes(st.session_state.get("load_table_seen"), editor_state, len(default_loads))
+if "load_totals" not in st.session_state or changed_rows is None:
+    st.session_state.load_totals = RunningTotals(load_df["Weight (lbs)"].fillna(0.0),
+                                                 load_df[load_cg_column].fillna(0.0))
+else:
+    for i in changed_rows:
+        row = load_df.iloc[i]
+        st.session_state.load_totals.update(i, float(np.nan_to_num(row["Weight (lbs)"])),
+                                            float(np.nan_to_num(row[load_cg_column])))
+st.session_state.load_table_seen = copy.deepcopy(dict(editor_state))
+table_weight, table_moment = st.session_state.load_totals.totals()
+dist_weight, dist_moment = distributed_totals(dist_starts, dist_ends, dist_q_starts, dist_q_ends)
+tank_weight, tank_moment = tank_totals(tank_capacities, tank_cgs, tank_fills)
+cargo_weight = table_weight + float(dist_weight) + tank_weight
+cargo_moment = table_moment + float(dist_moment) + tank_moment
+total_weight, total_moment = cargo_weight, cargo_moment
 if trailer_weight > 0:
-    loads.append((trailer_weight, trailer_cg))
-
-# Calculations
-total_weight = sum(w for w, _ in loads)
-total_moment = sum(w * cg for w, cg in loads)
-
-# Tongue force (positive = downward)
-raw_tongue_force = (total_moment - total_weight * axle_avg) / axle_avg
-tongue_force_display = round(-raw_tongue_force, 2)  # Negate to show downward as positive
-
-tongue_pct = 100 * tongue_force_display / total_weight if total_weight else 0
+    total_weight += trailer_weight
+    total_moment += trailer_weight * trailer_cg
+# Point loads as drawn, then every load in order: table rows, distributed equivalents, tanks, trailer
+point_loads = LoadTable(np.append(load_table.weights, tank_contents), np.append(load_table.cgs, tank_cgs),
+                        np.append(load_table.offsets, np.zeros(len(tank_cgs)))).with_trailer(trailer_weight, trailer_cg)
+cargo = LoadTable(np.concatenate([load_table.weights, dist_weights, tank_contents]),
+                  np.concatenate([load_table.cgs, dist_cgs, tank_cgs]),
+                  np.concatenate([load_table.offsets, np.zeros(len(dist_weights) + len(tank_cgs))]))
+loads = cargo.with_trailer(trailer_weight, trailer_cg)
+# The axles act as one virtual axle where the chosen suspension puts their resultant, so the hitch reaction
+# below and every section that uses it agree with the per-axle table
+axle_avg = float(effective_axle_position(axle_positions, suspension, axle_stiffness, hitch_position))
+# Solvers that take a list of axles and average it get the virtual axle itself
+solver_axles = axle_positions if suspension == "equalized" else [axle_avg]
+result = solve_totals(total_weight, total_moment, axle_avg, hitch_position, hitch_type)
+total_weight = result.total_weight
+tongue_force_display = result.tongue_force_display
+tongue_pct = result.tongue_pct
+# Everything except the load table rows: trailer structure, distributed loads and tanks
+base_weight = total_weight - table_weight
+base_moment = total_moment - table_moment
 
 # Results
 col1, col2 = st.columns(2)
 with col1:
     st.metric("Total Load", f"{total_weight:.1f} lbs")
-    st.metric("Tongue Weight", f"{tongue_force_display:.1f} lbs ({tongue_pct:.1f}%)")
+    st.metric(force_name, f"{tongue_force_display:.1f} lbs ({tongue_pct:.1f}%)")
 
 with col2:
-    if total_weight == 0:
+    band = f"{band_low:.0f}–{band_high:.0f}%"
+    if result.status == "zero":
         st.warning("⚠️ Total trailer load is zero.")
-    elif tongue_pct < 10:
-        st.warning(f"⚠️ Tongue weight is too low: {tongue_pct:.1f}% (Recommended: 10–15%)")
-    elif tongue_pct > 15:
-        st.warning(f"⚠️ Tongue weight is too high: {tongue_pct:.1f}% (Recommended: 10–15%)")
+    elif result.status == "low":
+        st.warning(f"⚠️ {force_name.capitalize()} is too low: {tongue_pct:.1f}% (Recommended: {band})")
+    elif result.status == "high":
+        st.warning(f"⚠️ {force_name.capitalize()} is too high: {tongue_pct:.1f}% (Recommended: {band})")
+    else:
+        st.success(f"✅ {force_name.capitalize()} is within range: {tongue_pct:.1f}%")
+
+# Axle Loads
+axle_result = axle_reactions(total_weight, result.total_moment, axle_positions, suspension, axle_stiffness,
+                             hitch_position)
+axle_loads = axle_result.reactions.tolist()
+utilization = axle_utilization(axle_result.reactions, axle_rating)
+# Distributed loads and the trailer structure sit on the centreline
+wheels = wheel_loads(axle_result.reactions, load_table.lateral_moment(), track_width)
+st.subheader("🛞 Axle Loads")
+st.dataframe(
+    pd.DataFrame({
+        "Axle": [f"Axle {i+1}" for i in range(num_axles)],
+        "Position (in)": axle_positions,
+        "Load (lbs)": axle_loads,
+        "Left Wheel (lbs)": wheels.left,
+        "Right Wheel (lbs)": wheels.right,
+        "Rating Used (%)": 100 * utilization,
+    }).style.format({"Position (in)": "{:.0f}", "Load (lbs)": "{:.0f}", "Left Wheel (lbs)": "{:.0f}",
+                     "Right Wheel (lbs)": "{:.0f}", "Rating Used (%)": "{:.0f}"}),
+    hide_index=True,
+)
+st.caption(f"Left side: {float(wheels.left_total):.0f} lbs · Right side: {float(wheels.right_total):.0f} lbs · "
+           f"Lateral CG: {float(np.nan_to_num(wheels.lateral_cg)):+.1f} in")
+if suspension != "equalized":
+    st.caption(f"{force_name} and axle loads use the {suspension_label.lower()} model: the axle group acts at "
+               f"{axle_avg:.1f} in rather than the average axle position.")
+for i in range(num_axles):
+    if utilization[i] > 1:
+        st.warning(f"⚠️ Axle {i+1} is overloaded: {axle_loads[i]:.0f} lbs (Rating: {axle_rating:.0f} lbs)")
+    for side, load in (("left", wheels.left[i]), ("right", wheels.right[i])):
+        if load < 0:
+            st.warning(f"⚠️ Axle {i+1} {side} wheel lifts off: move loads back towards the centreline")
+        elif load > axle_rating / 2 and utilization[i] <= 1:
+            st.warning(f"⚠️ Axle {i+1} {side} wheel carries {load:.0f} lbs, over half the axle rating")
+
+with st.expander("🧭 Plan View"):
+    deck_width = st.number_input("Deck Width (in)", min_value=1.0, value=102.0)
+    st.image(cached_plan_view(trailer_length, deck_width, axle_positions,
+                              (point_loads.weights, point_loads.cgs, point_loads.offsets), track_width,
+                              wheels.left, wheels.right, hitch_position))
+
+# Tow Vehicle
+with st.expander("🛻 Tow Vehicle Axle Loads"):
+    tv_col1, tv_col2, tv_col3 = st.columns(3)
+    wheelbase = tv_col1.number_input("Wheelbase (in)", min_value=1.0, value=145.0)
+    hitch_overhang = tv_col1.number_input("Rear Axle to Hitch (in)", value=48.0 if hitch_type == "bumper" else 0.0,
+                                          help="Negative when the hitch sits ahead of the rear axle")
+    curb_front = tv_col2.number_input("Curb Front Axle Weight (lbs)", min_value=1.0, value=3500.0)
+    curb_rear = tv_col2.number_input("Curb Rear Axle Weight (lbs)", min_value=0.0, value=2700.0)
+    front_gawr = tv_col3.number_input("Front GAWR (lbs)", min_value=1.0, value=3900.0)
+    rear_gawr = tv_col3.number_input("Rear GAWR (lbs)", min_value=1.0, value=4800.0)
+    tv = tow_vehicle_loads(tongue_force_display, wheelbase, hitch_overhang, curb_front, curb_rear)
+    tv_col1.metric("Front Axle", f"{float(tv.front_axle):.0f} lbs", f"{float(tv.front_axle) - curb_front:+.0f} lbs")
+    tv_col2.metric("Rear Axle", f"{float(tv.rear_axle):.0f} lbs", f"{float(tv.rear_axle) - curb_rear:+.0f} lbs",
+                   delta_color="inverse")
+    tv_col3.metric("Front Axle Unload", f"{float(tv.front_unload_pct):.1f}%")
+    if tv.rear_axle > rear_gawr:
+        st.warning(f"⚠️ Rear axle exceeds its rating: {float(tv.rear_axle):.0f} lbs (GAWR: {rear_gawr:.0f} lbs)")
+    if tv.front_axle > front_gawr:
+        st.warning(f"⚠️ Front axle exceeds its rating: {float(tv.front_axle):.0f} lbs (GAWR: {front_gawr:.0f} lbs)")
+
+    # A disabled toggle keeps its last value, so check the hitch type as well
+    use_wdh = st.toggle("Weight-distribution hitch", disabled=hitch_type != "bumper",
+                        help="Spring bars apply to bumper-pull hitches only")
+    if use_wdh and hitch_type == "bumper":
+        wdh_col1, wdh_col2, wdh_col3 = st.columns(3)
+        bar_rating = wdh_col1.number_input("Spring Bar Rating (lbs tongue)", min_value=1.0, value=1200.0)
+        bar_length = wdh_col1.number_input("Spring Bar Length (in)", min_value=1.0, value=DEFAULT_BAR_LENGTH)
+        wdh_mode = wdh_col2.radio("Set", ["Target restoration", "Chain tension"])
+        if wdh_mode == "Target restoration":
+            restoration_target = wdh_col2.number_input("Front Axle Restoration (%)", min_value=0.0, value=50.0,
+                                                       step=5.0)
+            bar_tension = float(tension_for_restoration(restoration_target, tongue_force_display, axle_avg,
+                                                        wheelbase, hitch_overhang, bar_length))
+        else:
+            bar_tension = wdh_col2.number_input("Chain Tension per Bar (lbs)", min_value=0.0, value=300.0)
+        wdh = wdh_loads(tongue_force_display, axle_avg, bar_tension, wheelbase, hitch_overhang, curb_front,
+                        curb_rear, bar_length)
+        wdh_col3.metric("Chain Tension per Bar", f"{bar_tension:.0f} lbs")
+        wdh_col3.metric("Front Axle Restored", f"{float(wdh.front_axle):.0f} lbs",
+                        f"{float(wdh.restoration_pct):.0f}% restored")
+        wdh_col1.metric("Ball Load", f"{float(wdh.ball_force):.0f} lbs")
+        wdh_col2.metric("Rear Axle", f"{float(wdh.rear_axle):.0f} lbs")
+        st.caption(f"Trailer axles carry {float(wdh.trailer_axle_gain):.0f} lbs more with the bars tensioned.")
+        if tongue_force_display > bar_rating:
+            st.warning(f"⚠️ Tongue weight exceeds the spring bar rating ({bar_rating:.0f} lbs)")
+
+# Sway Stability (uses the tow vehicle above)
+with st.expander("🌀 Sway Stability"):
+    sway_col1, sway_col2, sway_col3 = st.columns(3)
+    check_speed = sway_col1.number_input("Check Speed (mph)", min_value=5.0, value=55.0, step=5.0)
+    car_cornering = sway_col2.number_input("Tow Vehicle Cornering Stiffness (per rad)", min_value=0.1, value=10.0,
+                                           help="Lateral force per lb of axle load per radian of slip")
+    trailer_cornering = sway_col3.number_input("Trailer Cornering Stiffness (per rad)", min_value=0.1, value=6.0)
+    if total_weight > 0:
+        yaw_inertia = trailer_yaw_inertia(cargo.weights, cargo.cgs, cargo.offsets, trailer_weight, trailer_cg,
+                                          trailer_length)
+        sway_args = (wheelbase, hitch_overhang, curb_front, curb_rear, hitch_position, car_cornering,
+                     trailer_cornering)
+        sway = sway_stability(total_weight, tongue_force_display, axle_avg, yaw_inertia, *sway_args,
+                              check_speed=check_speed)
+        critical = float(sway.critical_speed)
+        if np.isnan(critical):
+            critical_text = "n/a"
+            st.info("Enter the trailer length (or structure weight) to estimate the yaw inertia.")
+        else:
+            critical_text = f"{critical:.0f} mph" if np.isfinite(critical) else f"> {SCAN_SPEEDS_MPH[-1]:.0f} mph"
+        sway_col1.metric("Critical Sway Speed", critical_text)
+        sway_col2.metric(f"Sway Damping at {check_speed:.0f} mph", f"{float(sway.damping_ratio):.2f}")
+        sway_col3.metric("Sway Frequency", f"{float(sway.frequency):.2f} Hz")
+        if critical <= check_speed:
+            st.warning(f"⚠️ Sway is unstable above {critical:.0f} mph: move weight forward or slow down")
+
+        # Slide the table loads fore and aft together to see how stability tracks tongue %
+        deltas = np.linspace(-0.25, 0.25, 41) * trailer_length
+        shifted_moment = total_moment + deltas * table_weight
+        shifted_force = -raw_tongue_force(total_weight, shifted_moment, axle_avg, hitch_position)
+        shifted_cgs = cargo.cgs + deltas[:, None] * (np.arange(len(cargo)) < len(load_table))
+        shifted_inertia = trailer_yaw_inertia(cargo.weights, shifted_cgs, cargo.offsets, trailer_weight, trailer_cg,
+                                              trailer_length)
+        curve = sway_stability(total_weight, shifted_force, axle_avg, shifted_inertia, *sway_args,
+                               check_speed=check_speed)
+        st.line_chart(pd.DataFrame({
+            f"{force_name} (%)": (100 * shifted_force / total_weight).round(2),
+            "Critical Speed (mph)": np.minimum(curve.critical_speed, SCAN_SPEEDS_MPH[-1]),
+        }), x=f"{force_name} (%)", y="Critical Speed (mph)")
+        st.caption("Linear yaw model with linear tires and no relaxation length; treat the speeds as a comparison "
+                   f"between loadouts rather than a guarantee. Curves are capped at {SCAN_SPEEDS_MPH[-1]:.0f} mph.")
+
+# Dynamic Loads
+with st.expander("🛑 Braking, Acceleration & Grade"):
+    dyn_col1, dyn_col2, dyn_col3 = st.columns(3)
+    # Bumper balls sit near 18 in; gooseneck balls and fifth-wheel pins sit in the pickup bed, near 48 in
+    hitch_height = dyn_col1.number_input("Hitch Height (in)", min_value=0.0,
+                                         value=18.0 if hitch_type == "bumper" else 48.0)
+    deck_height = dyn_col1.number_input("Deck Height (in)", min_value=0.0, value=24.0,
+                                        help="Distributed loads, tanks and the trailer structure sit at this height")
+    max_braking = dyn_col2.number_input("Max Braking (g)", min_value=0.0, value=DEFAULT_MAX_BRAKING_G, step=0.05)
+    max_accel = dyn_col2.number_input("Max Acceleration (g)", min_value=0.0, value=DEFAULT_MAX_ACCEL_G, step=0.05)
+    max_grade = dyn_col3.number_input("Max Grade (±%)", min_value=0.0, value=DEFAULT_MAX_GRADE_PCT, step=1.0)
+    brake_share = dyn_col3.slider("Trailer Brake Share (%)", 0, 100, 0,
+                                  help="Share of the trailer's own braking done by its brakes") / 100
+    if total_weight > 0:
+        height_moment = load_table.height_moment() + base_weight * deck_height
+        envelope = tongue_envelope(total_weight, total_moment, height_moment, axle_avg, hitch_height, hitch_position,
+                                   brake_share, max_braking, max_accel, max_grade)
+        for col, name, case in ((dyn_col1, "Lightest", envelope.lightest), (dyn_col2, "Heaviest", envelope.heaviest)):
+            col.metric(f"{name} {force_name}", f"{case.tongue_force:.0f} lbs ({case.tongue_pct:.1f}%)",
+                       f"{case.tongue_force - tongue_force_display:+.0f} lbs", delta_color="off",
+                       help=f"At {case.accel:+.2f} g on a {case.grade:+.1f}% grade")
+        if envelope.lightest.tongue_force < 0:
+            st.warning(f"⚠️ The hitch unloads at {envelope.lightest.accel:+.2f} g on a "
+                       f"{envelope.lightest.grade:+.1f}% grade")
+        elif envelope.lightest.tongue_pct < band_low:
+            st.warning(f"⚠️ {force_name.capitalize()} drops to {envelope.lightest.tongue_pct:.1f}% "
+                       f"(below {band}) at {envelope.lightest.accel:+.2f} g on a {envelope.lightest.grade:+.1f}% grade")
+        if st.toggle("Show envelope map"):
+            st.image(render_figure(
+                lambda fig: draw_heatmap(fig, envelope.accels, envelope.grades, envelope.tongue_pct,
+                                         "Longitudinal Acceleration (g, − = braking)", "Grade (%, + = uphill)",
+                                         band_low, band_high, label=f"{force_name} (%)"),
+                figsize=(8, 5)))
+
+# Load Placement Optimizer
+with st.expander("🎯 Balance Loads to a Target Tongue %"):
+    target_pct = st.number_input(f"Target {force_name} (%)", min_value=0.0, max_value=100.0,
+                                 value=band_centre, step=0.5)
+    balance_mode = st.radio("Adjustment", ["Move one load", "Spread over all loads"], horizontal=True)
+    # Distributed loads and the trailer structure stay put; loads stay on the deck
+    movable = np.arange(len(loads)) < len(load_table)
+    if balance_mode == "Move one load":
+        shifts, feasible = single_load_shifts(loads.weights, loads.cgs, solver_axles, target_pct,
+                                              lower=0, upper=trailer_length, hitch_position=hitch_position)
+        suggestion = pd.DataFrame({
+            "Load": [f"Load {i+1}" for i in range(len(load_table))],
+            "Current CG (in)": load_table.cgs,
+            "New CG (in)": load_table.cgs + shifts[movable],
+            "Move (in)": shifts[movable],
+            "Reaches Target": feasible[movable],
+        }).sort_values("Move (in)", key=np.abs)
+        st.dataframe(suggestion[suggestion["Reaches Target"]].head(10), hide_index=True)
+        if not feasible[movable].any():
+            st.warning("⚠️ No single load can reach the target while staying on the deck.")
     else:
-        st.success(f"✅ Tongue weight is within range: {tongue_pct:.1f}%")
+        placement = rebalance_loads(loads.weights, loads.cgs, solver_axles, target_pct, movable=movable,
+                                    lower=0, upper=trailer_length, hitch_position=hitch_position)
+        st.dataframe(pd.DataFrame({
+            "Load": [f"Load {i+1}" for i in range(len(load_table))],
+            "Current CG (in)": load_table.cgs,
+            "New CG (in)": placement.cgs[movable],
+            "Move (in)": placement.shifts[movable],
+        }), hide_index=True)
+        if placement.feasible:
+            st.success(f"✅ {force_name.capitalize()} after moving: {placement.tongue_pct:.1f}%")
+        else:
+            st.warning(f"⚠️ Target not reachable on the deck; closest is {placement.tongue_pct:.1f}%")
+
+# Monte Carlo Uncertainty
+with st.expander("🎲 Uncertainty (Monte Carlo)"):
+    mc_col1, mc_col2, mc_col3 = st.columns(3)
+    weight_tol_pct = mc_col1.number_input("Load Weight Tolerance (±%, 1σ)", min_value=0.0, value=2.0, step=0.5)
+    cg_tol = mc_col2.number_input("Load CG Tolerance (±in, 1σ)", min_value=0.0, value=3.0, step=0.5)
+    mc_samples = mc_col3.selectbox("Samples", [10_000, 100_000, 1_000_000], index=2, format_func="{:,}".format)
+    trailer_weight_tol = mc_col1.number_input("Trailer Weight Tolerance (±lbs, 1σ)", min_value=0.0, value=0.0)
+    trailer_cg_tol = mc_col2.number_input("Trailer CG Tolerance (±in, 1σ)", min_value=0.0, value=0.0)
+    if st.toggle("Run simulation") and total_weight > 0:
+        weight_sd = loads.weights * weight_tol_pct / 100
+        cg_sd = np.full(len(loads), cg_tol)
+        if trailer_weight > 0:
+            weight_sd[-1], cg_sd[-1] = trailer_weight_tol, trailer_cg_tol
+        mc = simulate(loads.weights, loads.cgs, solver_axles, weight_sd, cg_sd, samples=mc_samples, seed=0,
+                      low=band_low, high=band_high, hitch_position=hitch_position)
+        mc_col1.metric("Mean Tongue %", f"{mc.mean:.2f}%", help=f"σ = {mc.std:.2f}%")
+        mc_col2.metric("90% Interval", f"{mc.p5:.1f}–{mc.p95:.1f}%")
+        mc_col3.metric(f"P(outside {band})", f"{100 * mc.p_out:.1f}%",
+                       help=f"Too low: {100 * mc.p_low:.1f}% · Too high: {100 * mc.p_high:.1f}%")
+        centers = 0.5 * (mc.hist_edges[:-1] + mc.hist_edges[1:])
+        st.bar_chart(pd.DataFrame({"Tongue %": centers.round(2), "Samples": mc.hist_counts}), x="Tongue %", y="Samples")
+
+# Sensitivity (a fragment, so changing its controls only reruns this section)
+@st.fragment
+def sensitivity_section():
+    st.subheader("🌪️ Sensitivity")
+    sens_col1, sens_col2, sens_col3 = st.columns(3)
+    weight_step = sens_col1.number_input("Weight Change (±%)", min_value=0.1, value=10.0, step=1.0)
+    position_step = sens_col2.number_input("Position Change (±in)", min_value=0.1, value=6.0, step=1.0)
+    top_n = sens_col3.number_input("Inputs Shown", min_value=1, value=10)
+    if total_weight == 0:
+        st.info("Add load weight to see sensitivities.")
+        return
+    _, pct_sens = sensitivities(cargo.weights, cargo.cgs, solver_axles, trailer_weight, trailer_cg, hitch_position)
+    # Rank table rows only; distributed loads still count towards the totals
+    pct_sens = pct_sens._replace(load_weight=pct_sens.load_weight[:len(load_table)],
+                                 load_cg=pct_sens.load_cg[:len(load_table)])
+    labels, swings = ranked_effects(pct_sens, load_table.weights, weight_step, position_step, trailer_weight)
+    labels, swings = labels[:top_n], swings[:top_n]
+    st.image(cached_tornado(labels, tongue_pct - swings, tongue_pct + swings, tongue_pct))
+    if suspension != "equalized":
+        st.caption(f"Axle 1 is the virtual axle at {axle_avg:.1f} in that stands for the whole axle group.")
+
+
+sensitivity_section()
+
+# Parameter Sweep
+def sweep_default(name):
+    kind, _, index = name.partition(":")
+    if kind == "load_weight":
+        return float(load_table.weights[int(index)])
+    if kind == "load_cg":
+        return float(load_table.cgs[int(index)])
+    if kind == "axle":
+        return float(axle_positions[int(index)])
+    return float(trailer_weight if kind == "trailer_weight" else trailer_cg)
+
+
+@st.fragment
+def sweep_section():
+    with st.expander("🗺️ Parameter Sweep"):
+        names = parameter_names(len(load_table), num_axles)
+        sweep_col1, sweep_col2 = st.columns(2)
+        axes = []
+        for col, axis, default in ((sweep_col1, "X", 1), (sweep_col2, "Y", 2)):
+            name = col.selectbox(f"{axis} Input", names, index=min(default, len(names) - 1),
+                                 format_func=parameter_label, key=f"sweep_{axis}")
+            centre = sweep_default(name)
+            span = max(abs(centre) * 0.5, 24.0)
+            lo = col.number_input(f"{axis} Min", value=round(centre - span), key=f"sweep_{axis}_min_{name}")
+            hi = col.number_input(f"{axis} Max", value=round(centre + span), key=f"sweep_{axis}_max_{name}")
+            step = col.number_input(f"{axis} Step", min_value=1e-3, value=max(round((hi - lo) / 200, 3), 1e-3),
+                                    key=f"sweep_{axis}_step_{name}")
+            axes.append((name, (lo, hi), step))
+        (px, x_range, step_x), (py, y_range, step_y) = axes
+        if px == py:
+            st.info("Choose two different inputs to sweep.")
+            return
+        if x_range[1] <= x_range[0] or y_range[1] <= y_range[0]:
+            st.info("Each Max must be greater than its Min.")
+            return
+        rows, columns = Sweep.grid_shape(x_range, step_x, y_range, step_y)
+        if rows * columns > MAX_CELLS:
+            st.info(f"A {columns} × {rows} grid is too large (limit {MAX_CELLS:,} cells): increase a step or "
+                    "narrow a range.")
+            return
+        engine = Sweep(cargo.weights, cargo.cgs, axle_positions, trailer_weight, trailer_cg,
+                       hitch_position=hitch_position)
+        # The grid is only assembled when the rendered heatmap is not already cached
+        st.image(cached_heatmap((engine.key, px, x_range, step_x, py, y_range, step_y),
+                                lambda: engine.grid(px, x_range, step_x, py, y_range, step_y),
+                                parameter_label(px), parameter_label(py), band_low, band_high,
+                                label=f"{force_name} (%)"))
+        st.caption(f"{columns} × {rows} grid · {engine.cache.stats().size} tiles cached")
+        if suspension != "equalized":
+            st.caption("The sweep treats the axles as equalized so each one can be varied on its own.")
+
+
+sweep_section()
+
+# Loading Sequence (table rows loaded top to bottom onto the trailer and distributed loads)
+with st.expander("🏗️ Loading Sequence"):
+    check_from = st.number_input("Check Band From Step", min_value=1, value=1,
+                                 help="Early steps on a nearly empty trailer can be exempt from the band check")
+    too_many = len(load_table) > MAX_ORDER_ITEMS
+    find_order = st.toggle(f"Find a safe loading order (up to {MAX_ORDER_ITEMS} loads)", disabled=too_many)
+    if find_order and not too_many:
+        order = find_safe_order(load_table.weights, load_table.cgs, solver_axles, base_weight, base_moment,
+                                band_low, band_high, check_from=check_from, hitch_position=hitch_position)
+        if order is None:
+            st.warning("⚠️ No loading order keeps every step within the band.")
+            order = list(range(len(load_table)))
+        else:
+            st.success("✅ Loading order: " + " → ".join(f"Load {i+1}" for i in order))
+    else:
+        order = list(range(len(load_table)))
+    steps = list(simulate_sequence(zip(load_table.weights[order], load_table.cgs[order]), solver_axles,
+                                   base_weight, base_moment, band_low, band_high, hitch_position))
+    if steps:
+        seq_df = pd.DataFrame({
+            "Step": [s.step for s in steps],
+            "Load": [f"Load {i+1}" for i in order],
+            "Total Weight (lbs)": [s.total_weight for s in steps],
+            f"{force_name} (lbs)": [s.tongue_force for s in steps],
+            "Tongue %": [s.tongue_pct for s in steps],
+        })
+        st.line_chart(seq_df, x="Step", y="Tongue %")
+        bad = [s.step for s in steps[check_from - 1:] if s.status != "ok"]
+        if bad:
+            shown = ", ".join(map(str, bad[:10])) + (", …" if len(bad) > 10 else "")
+            st.warning(f"⚠️ Out of band after {len(bad)} step(s): {shown}")
+        st.dataframe(seq_df, hide_index=True)
+
+# Cargo Planner (packs a separate item list onto the deck around the trailer and distributed loads)
+with st.expander("📐 Cargo Planner"):
+    items_df = st.data_editor(
+        pd.DataFrame({"Weight (lbs)": [4000.0, 2500.0, 1500.0], "Length (in)": [60.0, 40.0, 48.0]}),
+        num_rows="dynamic",
+        hide_index=True,
+        key="planner_items",
+    ).dropna()
+    plan_col1, plan_col2, plan_col3 = st.columns(3)
+    deck_start = plan_col1.number_input("Deck Start (in)", value=0.0)
+    deck_end = plan_col2.number_input("Deck End (in)", value=float(trailer_length))
+    plan_target = plan_col3.number_input(f"Target {force_name} %", min_value=0.0, max_value=100.0,
+                                         value=band_centre, step=0.5, key=f"plan_target_{hitch_type}")
+    exact_plan = st.toggle(f"Exact search (up to {MAX_EXACT_ITEMS} items)", disabled=len(items_df) > MAX_EXACT_ITEMS)
+    if len(items_df):
+        plan = plan_cargo(items_df["Weight (lbs)"].to_numpy(float), items_df["Length (in)"].to_numpy(float),
+                          solver_axles, deck_start, deck_end,
+                          base_weight=base_weight, base_moment=base_moment, target_pct=plan_target,
+                          axle_group_rating=axle_rating * num_axles, low=band_low, high=band_high, exact=exact_plan,
+                          hitch_position=hitch_position)
+        if plan.feasible:
+            st.success(f"✅ Planned {force_name.lower()}: {plan.tongue_force:.0f} lbs ({plan.tongue_pct:.1f}%)")
+        else:
+            st.warning(f"⚠️ No arrangement meets every limit; best found: {plan.tongue_pct:.1f}% "
+                       f"{force_name.lower()}, {plan.axle_load:.0f} lbs on the axles")
+        st.dataframe(pd.DataFrame({
+            "Item": [f"Item {i+1}" for i in plan.order],
+            "Start (in)": plan.starts[plan.order],
+            "End (in)": plan.ends[plan.order],
+            "CG (in)": plan.cgs[plan.order],
+            "Weight (lbs)": items_df["Weight (lbs)"].to_numpy(float)[plan.order],
+        }), hide_index=True)
+        plan_loads = LoadTable(items_df["Weight (lbs)"], plan.cgs).with_trailer(trailer_weight, trailer_cg)
+        st.image(cached_layout(trailer_length, axle_positions, plan_loads, plan.tongue_force, distributed=distributed,
+                               hitch_position=hitch_position))
+
+# Consumables (tank contents change over the trip; everything else is fixed)
+with st.expander("🛢️ Consumables Over the Trip"):
+    if len(tank_df) == 0:
+        st.info("Add tanks in the sidebar to see how tongue weight changes as they drain.")
+    else:
+        fixed_weight, fixed_moment = total_weight - tank_weight, total_moment - tank_moment
+        cons_col1, cons_col2 = st.columns(2)
+        curve_mode = cons_col1.radio("Curve Over", ["Fill level", "Drain schedule"], horizontal=True)
+        curve_points = int(cons_col2.number_input("Points", min_value=2, max_value=100_000, value=1000))
+        if curve_mode == "Fill level":
+            curve = fill_curve(tank_capacities, tank_cgs, solver_axles, fixed_weight, fixed_moment, curve_points,
+                               band_low, band_high, hitch_position)
+            x_label, scale = "Fill (%)", 100
+        else:
+            trip_hours = cons_col1.number_input("Trip Length (h)", min_value=0.1, value=8.0)
+            curve = drain_curve(tank_capacities, tank_cgs, tank_fills, tank_rates,
+                                np.linspace(0.0, trip_hours, curve_points), solver_axles, fixed_weight,
+                                fixed_moment, band_low, band_high, hitch_position)
+            x_label, scale = "Time (h)", 1
+        points = list(curve)
+        curve_df = pd.DataFrame({x_label: [scale * float(p.x) for p in points],
+                                 f"{force_name} (%)": [p.tongue_pct for p in points]})
+        st.line_chart(curve_df, x=x_label, y=f"{force_name} (%)")
+        out = [p for p in points if p.status != "ok"]
+        if out:
+            st.warning(f"⚠️ Out of band ({band}) for {len(out)} of {len(points)} points, "
+                       f"first at {x_label} {scale * float(out[0].x):.1f}: {out[0].tongue_pct:.1f}%")
+        else:
+            st.success(f"✅ {force_name.capitalize()} stays within {band} over the whole curve")
+
+# Scale Tickets (inverse mode: infer unknowns from measured hitch and axle group weights)
+with st.expander("⚖️ Scale Tickets"):
+    scale_col1, scale_col2 = st.columns(2)
+    measured_tongue = scale_col1.number_input(f"Measured {force_name} (lbs)", min_value=0.0, value=0.0)
+    measured_axles = scale_col2.number_input("Measured Axle Group (lbs)", min_value=0.0, value=0.0)
+    unknown = st.radio("Solve For", ["Trailer weight & CG", "One load's CG"], horizontal=True)
+    if measured_tongue + measured_axles > 0:
+        if unknown == "Trailer weight & CG":
+            # Table rows and distributed loads are known; the sidebar trailer values are ignored
+            solved = solve_trailer(measured_tongue, measured_axles, axle_avg, cargo_weight, cargo_moment,
+                                   hitch_position)
+            scale_col1.metric("Trailer Weight", f"{float(solved.trailer_weight):.0f} lbs")
+            scale_col2.metric("Trailer CG", f"{float(solved.trailer_cg):.1f} in")
+            if solved.trailer_weight < 0:
+                st.warning("⚠️ The known loads weigh more than the scale reading.")
+            st.caption("Enter these in the sidebar to use them everywhere else.")
+        elif len(load_table):
+            row = st.selectbox("Load", range(len(load_table)), format_func=lambda i: f"Load {i+1}")
+            row_weight, row_cg = load_table.weights[row], load_table.cgs[row]
+            solved = solve_load_cg(measured_tongue, measured_axles, axle_avg, row_weight, total_weight - row_weight,
+                                   total_moment - row_weight * row_cg, hitch_position)
+            scale_col1.metric(f"Load {row+1} CG", f"{float(solved.cg):.1f} in",
+                              f"{float(solved.cg) - load_table.cgs[row]:+.1f} in vs table", delta_color="off")
+            scale_col2.metric("Weight Mismatch", f"{float(solved.weight_residual):+.0f} lbs",
+                              help="Scale total minus the weights entered in the app")
+
+    st.markdown("**Fit empty trailers from many tickets**")
+    tickets_file = st.file_uploader("Scale tickets (CSV)", type="csv")
+    st.caption("Columns: trailer, tongue_weight, axle_weight, cargo_weight, cargo_cg. "
+               "Every ticket uses the axle and hitch positions from the sidebar.")
+    if tickets_file is not None:
+        tickets = pd.read_csv(tickets_file)
+        fit = fit_trailer(tickets["tongue_weight"].to_numpy(float), tickets["axle_weight"].to_numpy(float), axle_avg,
+                          tickets["cargo_weight"].to_numpy(float),
+                          (tickets["cargo_weight"] * tickets["cargo_cg"]).to_numpy(float), hitch_position,
+                          groups=tickets["trailer"].astype(str) if "trailer" in tickets else None)
+        st.dataframe(pd.DataFrame({
+            "Trailer": fit.groups if "trailer" in tickets else ["All tickets"],
+            "Tickets": fit.tickets,
+            "Empty Weight (lbs)": fit.trailer_weight,
+            "± (lbs, 95%)": fit.weight_margin,
+            "Empty CG (in)": fit.trailer_cg,
+            "± (in, 95%)": fit.cg_margin,
+        }).style.format(precision=1), hide_index=True)
 
 # Plot
-fig, ax = plt.subplots(figsize=(10, 3))
-ax.set_xlim(0, trailer_length)
-ax.set_ylim(-1.5, 1.5)
-ax.get_yaxis().set_visible(False)
-ax.set_xlabel("Distance from Hitch (in)")
-
-# Tongue weight dot at 0
-ax.plot(0, 0, "ro", label=f"Tongue Weight: {tongue_force_display:.0f} lbs (0 in)")
-
-# Plot real axles
-for i, pos in enumerate(axle_positions):
-    ax.axvline(pos, color='gray', linestyle='--', label=f"Axle {i+1}: {pos:.0f} in")
-
-# Plot virtual axle (avg)
-ax.axvline(axle_avg, color='blue', linestyle=':', label=f"Virtual Axle: {axle_avg:.1f} in")
-
-# Plot loads (dots only, labels in legend)
-for i, (w, cg) in enumerate(loads):
-    ax.plot(cg, 0, "go", label=f"Load {i+1}: {w:.0f} lbs at {cg:.0f} in")
-
-# Legend beside plot
-ax.legend(loc='center left', bbox_to_anchor=(1, 0.5), frameon=False)
-st.pyplot(fig)
-
-# PDF Export
-if st.button("📄 Export Results to PDF"):
-    with tempfile.TemporaryDirectory() as tmpdir:
-        image_path = os.path.join(tmpdir, "plot.png")
-        pdf_path = os.path.join(tmpdir, "tongue_weight_report.pdf")
-
-        fig.savefig(image_path, bbox_inches='tight', dpi=300, format='png')
-
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt="Trailer Tongue Weight Report", ln=True, align='C')
-        pdf.ln(5)
-        pdf.cell(200, 10, txt=f"Total Load: {total_weight:.1f} lbs", ln=True)
-        pdf.cell(200, 10, txt=f"Tongue Weight: {tongue_force_display:.1f} lbs ({tongue_pct:.1f}%)", ln=True)
-        pdf.cell(200, 10, txt=f"Axle Midpoint: {axle_avg:.1f} in", ln=True)
-        pdf.cell(200, 10, txt="Assumptions:", ln=True)
-        pdf.set_font("Arial", size=10)
-        pdf.multi_cell(0, 10, "- All axles treated as a single point load at average position.\n"
-                              "- Loads treated as point forces at CGs.\n"
-                              "- Trailer weight & CG are optional.\n"
-                              "- Positive tongue weight = downward force at hitch.")
-        pdf.image(image_path, x=10, y=None, w=180)
-        pdf.output(pdf_path)
-
-        with open(pdf_path, "rb") as f:
-            st.download_button("📥 Download PDF", f, file_name="tongue_weight_report.pdf", mime="application/pdf")
+st.image(cached_layout(trailer_length, axle_positions, point_loads, tongue_force_display, distributed=distributed,
+                       hitch_position=hitch_position))
+
+def configure_plot_cache():
+    # The cache is shared by every session, so only apply settings when this user changes them
+    layout_cache.configure(max_entries=st.session_state.cache_entries, ttl=st.session_state.cache_ttl)
+
+
+with st.sidebar.expander("🗂️ Plot Cache"):
+    st.number_input("Max Cached Plots", min_value=1, value=layout_cache.max_entries, key="cache_entries",
+                    on_change=configure_plot_cache)
+    st.number_input("Cache TTL (s)", min_value=0, value=int(layout_cache.ttl or 0), key="cache_ttl",
+                    on_change=configure_plot_cache, help="0 disables expiry; shared by all sessions")
+    stats = layout_cache.stats()
+    st.caption(f"{stats.hits} hits · {stats.misses} misses · {stats.size}/{stats.max_entries} entries")
+
+# PDF Export (built on click, entirely in memory)
+st.download_button(
+    "📄 Export Results to PDF",
+    data=lambda: build_report(result, cached_layout(trailer_length, axle_positions, point_loads,
+                                                     tongue_force_display, fmt="svg", distributed=distributed,
+                                                     hitch_position=hitch_position), hitch_type=hitch_type),
+    file_name="tongue_weight_report.pdf",
+    mime="application/pdf",
+    on_click="ignore",
+)